@@ -41,6 +41,7 @@ from database.queries import (
     update_session_outstanding,
 )
 from guardrails.safety import check_red_lines
+from tools.common import batched_tool_logs
 from tools.retention import generate_cancel_link, inject_cancel_link
 
 logger = structlog.get_logger()
@@ -295,7 +296,8 @@ class SupportOrchestrator:
                     ctx.classification.primary,
                     customer_email=ctx.customer_email,
                 )
-            response = await agent.arun(ctx.agent_input)
+            with batched_tool_logs(session_id=ctx.session_id):
+                response = await agent.arun(ctx.agent_input)
             return str(response.content)
 
         try:
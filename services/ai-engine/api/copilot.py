@@ -21,8 +21,9 @@ from typing import AsyncGenerator
 from uuid import uuid4
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, field_validator
+import orjson
 import structlog
 
 # AG-UI Protocol imports
@@ -55,6 +56,8 @@ from agents.instructions import load_instructions
 from agents.router import classify_message
 from config import settings
 from tools import TOOL_REGISTRY, WRITE_TOOLS
+from tools.customer import MAX_BATCH_EMAILS
+from tools.common import batched_tool_logs
 
 logger = structlog.get_logger()
 
@@ -149,6 +152,24 @@ OPENAI_TOOL_SCHEMAS: dict[str, dict] = {
             },
         },
     },
+    "get_subscriptions": {
+        "type": "function",
+        "function": {
+            "name": "get_subscriptions",
+            "description": "Get active subscription details for several customers in one call. Returns an object keyed by email.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "customer_emails": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Customer email addresses (up to 50)",
+                    },
+                },
+                "required": ["customer_emails"],
+            },
+        },
+    },
     "get_customer_history": {
         "type": "function",
         "function": {
@@ -767,7 +788,7 @@ async def _agent_stream(message: str, thread_id: str) -> AsyncGenerator[str, Non
 
             # Process tool calls
             hitl_emitted = False
-            read_only_results = []
+            read_only_calls = []
 
             # Build the assistant message with all tool calls for OpenAI conversation
             assistant_tool_calls = []
@@ -821,15 +842,25 @@ async def _agent_stream(message: str, thread_id: str) -> AsyncGenerator[str, Non
                     )
                     hitl_emitted = True
                 else:
-                    # Read-only tool: execute server-side
-                    result = await _execute_tool(tool_name, tool_args)
-                    read_only_results.append((tc["id"], tool_name, result))
+                    # Read-only tool: executed server-side below
+                    read_only_calls.append((tc["id"], tool_name, tool_args))
 
             # If HITL tool was emitted, stop the loop.
             # CopilotKit will handle the form and send a new request.
             if hitl_emitted:
                 break
 
+            # Run independent read-only tools concurrently (latency = max, not sum)
+            with batched_tool_logs(thread_id=thread_id, iteration=iteration):
+                results = await asyncio.gather(*(
+                    _execute_tool(tool_name, tool_args)
+                    for _, tool_name, tool_args in read_only_calls
+                ))
+            read_only_results = [
+                (tool_call_id, tool_name, result)
+                for (tool_call_id, tool_name, _), result in zip(read_only_calls, results)
+            ]
+
             # Feed read-only results back to OpenAI for next iteration
             if read_only_results:
                 openai_messages.append({
@@ -1128,7 +1159,10 @@ async def execute_tool(request: Request, req: ExecuteToolRequest):
             session_id=req.session_id,
         )
 
-        return {"status": "completed", "result": result_data}
+        return Response(
+            content=orjson.dumps({"status": "completed", "result": result_data}),
+            media_type="application/json",
+        )
 
     except Exception as e:
         logger.error("execute_tool_error", tool_name=req.tool_name, error=str(e), exc_info=True)
@@ -1139,6 +1173,7 @@ async def execute_tool(request: Request, req: ExecuteToolRequest):
 
 READ_ONLY_TOOLS: set[str] = {
     "get_subscription",
+    "get_subscriptions",
     "get_customer_history",
     "get_payment_history",
     "track_package",
@@ -1167,9 +1202,26 @@ class FetchDataRequest(BaseModel):
         if email:
             if len(email) > MAX_EMAIL_LENGTH or not EMAIL_REGEX.match(email):
                 raise ValueError("Invalid customer email format")
+        emails = v.get("customer_emails")
+        if emails is not None:
+            if not isinstance(emails, list) or len(emails) > MAX_BATCH_EMAILS:
+                raise ValueError(f"customer_emails must be a list of at most {MAX_BATCH_EMAILS} emails")
+            for e in emails:
+                if not isinstance(e, str) or len(e) > MAX_EMAIL_LENGTH or not EMAIL_REGEX.match(e):
+                    raise ValueError("Invalid customer email format")
         return v
 
 
+def _parse_tool_result(result: object) -> object:
+    """Decode a tool's JSON string output; non-JSON output is returned as-is."""
+    if isinstance(result, (str, bytes)):
+        try:
+            return orjson.loads(result)
+        except orjson.JSONDecodeError:
+            return result
+    return result
+
+
 @router.post("/fetch-data")
 async def fetch_data(req: FetchDataRequest):
     """Fetch read-only data for display widgets.
@@ -1190,10 +1242,12 @@ async def fetch_data(req: FetchDataRequest):
         result = tool_fn(**req.tool_args)
         if inspect.isawaitable(result):
             result = await result
-        result_data = json_lib.loads(result)
 
         logger.info("fetch_data_success", tool_name=req.tool_name)
-        return {"status": "ok", "result": result_data}
+        return Response(
+            content=orjson.dumps({"status": "ok", "result": _parse_tool_result(result)}),
+            media_type="application/json",
+        )
 
     except Exception as e:
         logger.error("fetch_data_error", tool_name=req.tool_name, error=str(e), exc_info=True)
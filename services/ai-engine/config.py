@@ -19,6 +19,11 @@ class Settings(BaseSettings):
     # Database (Supabase REST API)
     supabase_url: str = ""
     supabase_service_role_key: str = ""
+    supabase_pool_min_size: int = 10  # Keep-alive connections held open
+    supabase_pool_max_size: int = 50  # Max concurrent connections to PostgREST
+    supabase_timeout_s: float = 30.0
+    customer_cache_ttl_s: float = 60.0  # In-process customer query cache (0 = disabled)
+    customer_cache_max_size: int = 2048
 
     # Pinecone
     pinecone_api_key: str = ""
@@ -2,33 +2,73 @@
 
 Provides a shared Supabase client instance for REST API access.
 Uses service_role_key to bypass RLS (server-side only).
+
+The client is backed by a single pooled httpx.Client so concurrent
+tool calls reuse keep-alive connections instead of re-handshaking.
 """
 
+import threading
+
+import httpx
 import structlog
-from supabase import create_client, Client
+from supabase import ClientOptions, create_client, Client
 
 from config import settings
 
 logger = structlog.get_logger()
 
 _client: Client | None = None
+_http_client: httpx.Client | None = None
+_lock = threading.Lock()
 
 
 def get_client() -> Client:
     """Get or create the Supabase client singleton.
 
+    Thread-safe: tool functions may run in worker threads, so the first
+    concurrent callers must not race to build separate clients.
+
     Returns:
         Supabase Client instance.
 
     Raises:
         RuntimeError: If SUPABASE_URL or SUPABASE_SERVICE_ROLE_KEY is not set.
     """
-    global _client
-    if _client is None:
-        if not settings.supabase_url or not settings.supabase_service_role_key:
-            raise RuntimeError(
-                "SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set."
+    global _client, _http_client
+    if _client is not None:
+        return _client
+
+    with _lock:
+        if _client is None:
+            if not settings.supabase_url or not settings.supabase_service_role_key:
+                raise RuntimeError(
+                    "SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set."
+                )
+            _http_client = httpx.Client(
+                limits=httpx.Limits(
+                    max_connections=settings.supabase_pool_max_size,
+                    max_keepalive_connections=settings.supabase_pool_min_size,
+                ),
+                timeout=httpx.Timeout(settings.supabase_timeout_s),
+            )
+            _client = create_client(
+                settings.supabase_url,
+                settings.supabase_service_role_key,
+                options=ClientOptions(httpx_client=_http_client),
+            )
+            logger.info(
+                "supabase_client_initialized",
+                url=settings.supabase_url,
+                pool_max_size=settings.supabase_pool_max_size,
             )
-        _client = create_client(settings.supabase_url, settings.supabase_service_role_key)
-        logger.info("supabase_client_initialized", url=settings.supabase_url)
     return _client
+
+
+def close_client() -> None:
+    """Close the pooled HTTP connections (called on app shutdown)."""
+    global _client, _http_client
+    with _lock:
+        if _http_client is not None:
+            _http_client.close()
+        _client = None
+        _http_client = None
@@ -2,17 +2,84 @@
 
 Query functions for customers, subscriptions, orders, and tracking_events.
 Used by tools/customer.py, tools/shipping.py, tools/customization.py.
+
+Email-keyed lookups are memoized in a short-lived in-process TTL cache
+so repeat tool calls within a conversation skip the REST round trip.
+Concurrent misses for the same key (parallel tool calls in one agent
+turn) are single-flighted: one thread queries, the others wait for
+and reuse its result. Write tools call invalidate_customer_cache()
+after changing data.
 """
 
-from typing import Any
+import functools
+import threading
+from typing import Any, Callable
 
 import structlog
 
+from config import settings
+from database.cache import TTLCache
 from database.connection import get_client
 
 logger = structlog.get_logger()
 
+_customer_cache = TTLCache(
+    max_size=settings.customer_cache_max_size,
+    ttl_seconds=settings.customer_cache_ttl_s,
+)
+
+# Per-key locks for in-flight cache misses (single-flight)
+_inflight: dict[tuple, threading.Lock] = {}
+_inflight_guard = threading.Lock()
+
 
+def _cached_by_email(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Memoize a query function keyed by (name, normalized email, args).
+
+    Only non-None results are cached, so not-found customers and
+    swallowed query errors are retried on the next call. Concurrent
+    misses for one key run the query once.
+    """
+    @functools.wraps(fn)
+    def wrapper(email: str, *args: Any, **kwargs: Any) -> Any:
+        key = (fn.__name__, email.strip().lower(), *args, *sorted(kwargs.items()))
+        cached = _customer_cache.get(key)
+        if cached is not None:
+            return cached
+
+        with _inflight_guard:
+            lock = _inflight.setdefault(key, threading.Lock())
+        try:
+            with lock:
+                # Another thread may have filled the entry while we waited
+                cached = _customer_cache.get(key)
+                if cached is not None:
+                    return cached
+                result = fn(email, *args, **kwargs)
+                if result is not None:
+                    _customer_cache.set(key, result)
+                return result
+        finally:
+            with _inflight_guard:
+                if _inflight.get(key) is lock and not lock.locked():
+                    del _inflight[key]
+
+    return wrapper
+
+
+def invalidate_customer_cache(email: str) -> None:
+    """Drop cached query results for a customer after a write."""
+    dropped = _customer_cache.invalidate_email(email.strip().lower())
+    if dropped:
+        logger.info("customer_cache_invalidated", email=email, entries=dropped)
+
+
+def clear_customer_cache() -> None:
+    """Drop all cached customer query results."""
+    _customer_cache.clear()
+
+
+@_cached_by_email
 def lookup_customer(email: str) -> dict[str, Any] | None:
     """Find a customer by email address.
 
@@ -62,40 +129,143 @@ def get_subscriptions_by_customer(customer_id: int) -> list[dict[str, Any]]:
         return []
 
 
+def _pick_subscription(subs: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """Prefer the Active subscription, else the first one, else None."""
+    active = next((s for s in subs if s.get("status") == "Active"), None)
+    return active or (subs[0] if subs else None)
+
+
+@_cached_by_email
 def get_active_subscription_by_email(email: str) -> dict[str, Any] | None:
     """Get the active subscription for a customer by email.
 
     Returns the active subscription (or most recent if none active),
-    along with customer info and subscription count.
+    along with customer info and subscription count. Customer and
+    subscriptions are fetched in one request via PostgREST embedding.
 
     Args:
-        email: Customer email address.
+        email: Customer email (will be normalized to lowercase).
 
     Returns:
         Dict with customer info, subscription details, and count, or None.
     """
-    customer = lookup_customer(email)
-    if not customer:
+    normalized = email.strip().lower()
+    try:
+        response = (
+            get_client()
+            .table("customers")
+            .select("*, subscriptions(*)")
+            .eq("email", normalized)
+            .order("status", foreign_table="subscriptions")
+            .limit(1)
+            .execute()
+        )
+    except Exception:
+        logger.exception("get_active_subscription_failed", email=normalized)
         return None
 
-    subs = get_subscriptions_by_customer(customer["id"])
-    if not subs:
-        return {
+    if not response.data:
+        return None
+
+    customer = dict(response.data[0])
+    subs = customer.pop("subscriptions", None) or []
+
+    return {
+        "found": True,
+        "customer": customer,
+        "subscription": _pick_subscription(subs),
+        "subscriptions_count": len(subs),
+    }
+
+
+def get_active_subscriptions_by_emails(
+    emails: list[str],
+) -> dict[str, dict[str, Any]]:
+    """Get active subscriptions for several customers in one request.
+
+    Same shape per customer as get_active_subscription_by_email(), but
+    all customers are matched with a single ``email IN (...)`` filter.
+
+    Args:
+        emails: Customer emails (normalized to lowercase, deduplicated).
+
+    Returns:
+        Dict keyed by normalized email. Emails with no matching customer
+        are omitted; an empty dict is returned on query errors.
+    """
+    normalized = list(dict.fromkeys(e.strip().lower() for e in emails))
+    if not normalized:
+        return {}
+    try:
+        response = (
+            get_client()
+            .table("customers")
+            .select("*, subscriptions(*)")
+            .in_("email", normalized)
+            .order("status", foreign_table="subscriptions")
+            .execute()
+        )
+    except Exception:
+        logger.exception("get_active_subscriptions_batch_failed", count=len(normalized))
+        return {}
+
+    results: dict[str, dict[str, Any]] = {}
+    for row in response.data or []:
+        customer = dict(row)
+        subs = customer.pop("subscriptions", None) or []
+        results[customer["email"]] = {
             "found": True,
             "customer": customer,
-            "subscription": None,
-            "subscriptions_count": 0,
+            "subscription": _pick_subscription(subs),
+            "subscriptions_count": len(subs),
         }
+    return results
 
-    # Prefer Active subscription
-    active = next((s for s in subs if s.get("status") == "Active"), None)
-    chosen = active or subs[0]
+
+@_cached_by_email
+def get_subscription_with_last_order_by_email(email: str) -> dict[str, Any] | None:
+    """Get the active subscription and most recent order in one round trip.
+
+    Uses PostgREST resource embedding so customers, subscriptions and the
+    latest order are fetched with a single request instead of three.
+
+    Args:
+        email: Customer email (will be normalized to lowercase).
+
+    Returns:
+        Dict with customer info, chosen subscription, subscription count
+        and last order (or None), or None if the customer is not found.
+    """
+    normalized = email.strip().lower()
+    try:
+        response = (
+            get_client()
+            .table("customers")
+            .select("*, subscriptions(*), orders!orders_customer_id_fkey(*)")
+            .eq("email", normalized)
+            .order("status", foreign_table="subscriptions")
+            .order("created_at", desc=True, foreign_table="orders")
+            .limit(1, foreign_table="orders")
+            .limit(1)
+            .execute()
+        )
+    except Exception:
+        logger.exception("get_subscription_with_last_order_failed", email=normalized)
+        return None
+
+    if not response.data:
+        return None
+
+    customer = dict(response.data[0])
+    subs = customer.pop("subscriptions", None) or []
+    orders = customer.pop("orders", None) or []
 
     return {
         "found": True,
         "customer": customer,
-        "subscription": chosen,
+        "subscription": _pick_subscription(subs),
         "subscriptions_count": len(subs),
+        "last_order": orders[0] if orders else None,
     }
 
 
@@ -158,6 +328,7 @@ def get_orders_by_subscription(
         return []
 
 
+@_cached_by_email
 def get_payment_history_by_email(
     email: str, months: int = 6,
 ) -> dict[str, Any] | None:
@@ -212,6 +383,7 @@ def get_payment_history_by_email(
     }
 
 
+@_cached_by_email
 def get_tracking_by_email(email: str) -> dict[str, Any] | None:
     """Get the most recent tracking info for a customer.
 
@@ -270,6 +442,7 @@ def get_tracking_by_email(email: str) -> dict[str, Any] | None:
     }
 
 
+@_cached_by_email
 def get_customer_history_by_email(email: str) -> dict[str, Any] | None:
     """Get comprehensive customer history for retention analysis.
 
@@ -7,6 +7,7 @@ Includes Langfuse tracing via AgnoInstrumentor + OpenTelemetry.
 import os
 from contextlib import asynccontextmanager
 
+import orjson
 import structlog
 from fastapi import FastAPI
 
@@ -18,8 +19,10 @@ structlog.configure(
     processors=[
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.add_log_level,
-        structlog.processors.JSONRenderer(),
+        # orjson renders straight to bytes; BytesLogger writes them without a str round trip
+        structlog.processors.JSONRenderer(serializer=orjson.dumps),
     ],
+    logger_factory=structlog.BytesLoggerFactory(),
 )
 logger = structlog.get_logger()
 
@@ -64,6 +67,10 @@ async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
     logger.info("starting_ai_engine", version=settings.app_version)
     yield
+    # Release pooled Supabase connections
+    from database.connection import close_client
+
+    close_client()
     # Flush remaining traces
     try:
         provider = trace_api.get_tracer_provider()
@@ -16,6 +16,15 @@ from .sample_data import success_response, error_response
 logger = structlog.get_logger()
 
 
+def _new_claim_id() -> str:
+    """Generate a realistic claim ID, e.g. DMG-202602-417.
+
+    Built from the month prefix and a small random suffix; no UUID
+    object is constructed since only a short tag is needed.
+    """
+    return f"DMG-{datetime.now():%Y%m}-{random.randint(100, 999)}"
+
+
 class MockZohoAPI:
     """Mock Zoho CRM API for subscription management.
 
@@ -218,8 +227,7 @@ class MockDamageClaimAPI:
             api="mock",
         )
 
-        # Generate realistic claim ID
-        claim_id = f"DMG-{datetime.now().strftime('%Y%m')}-{random.randint(100, 999)}"
+        claim_id = _new_claim_id()
 
         return success_response(
             {
@@ -256,7 +264,7 @@ class MockDamageClaimAPI:
 
         # Use provided claim_id or generate new one
         if not claim_id:
-            claim_id = f"DMG-{datetime.now().strftime('%Y%m')}-{random.randint(100, 999)}"
+            claim_id = _new_claim_id()
 
         return success_response(
             {
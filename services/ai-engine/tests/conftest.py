@@ -3,9 +3,18 @@
 import pytest
 from fastapi.testclient import TestClient
 
+from database.customer_queries import clear_customer_cache
 from main import app
 
 
+@pytest.fixture(autouse=True)
+def _clear_customer_cache():
+    """Isolate tests from the in-process customer query cache."""
+    clear_customer_cache()
+    yield
+    clear_customer_cache()
+
+
 @pytest.fixture
 def client():
     """FastAPI test client."""
@@ -394,3 +394,60 @@ class TestHITLToolCalls:
         assert "RUN_FINISHED" in content
         # Tool was executed server-side
         mock_exec.assert_called_once()
+
+
+# --- Read-only data fetch endpoint ---
+
+
+class TestFetchData:
+    """Display widgets load tool output via /api/copilot/fetch-data."""
+
+    @patch("tools.shipping.get_tracking_by_email")
+    def test_returns_tool_payload(self, mock_query):
+        mock_query.return_value = None
+        response = client.post("/api/copilot/fetch-data", json={
+            "tool_name": "track_package",
+            "tool_args": {"customer_email": "user@test.com"},
+        })
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert data["status"] == "ok"
+        assert data["result"]["found"] is False
+        assert data["result"]["customer_email"] == "user@test.com"
+
+    @patch.dict("api.copilot.TOOL_REGISTRY", {"track_package": lambda **kwargs: "No tracking yet"})
+    def test_non_json_tool_output_is_a_string(self):
+        response = client.post("/api/copilot/fetch-data", json={
+            "tool_name": "track_package",
+            "tool_args": {"customer_email": "user@test.com"},
+        })
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok", "result": "No tracking yet"}
+
+    def test_rejects_write_tool(self):
+        response = client.post("/api/copilot/fetch-data", json={
+            "tool_name": "change_address",
+            "tool_args": {"customer_email": "user@test.com"},
+        })
+        assert response.json()["status"] == "error"
+
+
+class TestExecuteTool:
+    """Approved HITL writes run via /api/copilot/execute-tool."""
+
+    @patch("database.queries.save_tool_execution")
+    @patch("tools.subscription.lookup_customer")
+    def test_returns_tool_payload(self, mock_lookup, mock_audit):
+        mock_lookup.return_value = None
+        response = client.post("/api/copilot/execute-tool", json={
+            "tool_name": "skip_month",
+            "tool_args": {"customer_email": "user@test.com"},
+        })
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert data["status"] == "completed"
+        assert data["result"]["found"] is False
+        audit_row = mock_audit.call_args.args[0]
+        assert audit_row["tool_output"] == data["result"]
@@ -3,16 +3,23 @@
 All tests mock the Supabase client to avoid requiring a live database.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
+from database.cache import TTLCache
 from database.customer_queries import (
     get_active_subscription_by_email,
+    get_active_subscriptions_by_emails,
     get_customer_history_by_email,
     get_orders_by_customer,
     get_orders_by_subscription,
     get_payment_history_by_email,
+    get_subscription_with_last_order_by_email,
     get_subscriptions_by_customer,
     get_tracking_by_email,
+    invalidate_customer_cache,
     lookup_customer,
 )
 
@@ -107,6 +114,7 @@ def _mock_chain(response):
     chain = MagicMock()
     chain.select.return_value = chain
     chain.eq.return_value = chain
+    chain.in_.return_value = chain
     chain.order.return_value = chain
     chain.limit.return_value = chain
     chain.execute.return_value = response
@@ -191,46 +199,150 @@ class TestGetSubscriptionsByCustomer:
 
 
 class TestGetActiveSubscriptionByEmail:
-    @patch("database.customer_queries.get_subscriptions_by_customer")
-    @patch("database.customer_queries.lookup_customer")
-    def test_found_active(self, mock_lookup, mock_subs):
-        mock_lookup.return_value = SAMPLE_CUSTOMER
-        mock_subs.return_value = [SAMPLE_SUB_ACTIVE, SAMPLE_SUB_INACTIVE]
+    @staticmethod
+    def _client_returning(rows):
+        client = MagicMock()
+        client.table.return_value = _mock_chain(_mock_response(rows))
+        return client
+
+    @patch("database.customer_queries.get_client")
+    def test_found_active(self, mock_get_client):
+        mock_get_client.return_value = self._client_returning([
+            {**SAMPLE_CUSTOMER, "subscriptions": [SAMPLE_SUB_INACTIVE, SAMPLE_SUB_ACTIVE]},
+        ])
 
         result = get_active_subscription_by_email("test@example.com")
         assert result is not None
         assert result["found"] is True
         assert result["subscription"]["status"] == "Active"
         assert result["subscriptions_count"] == 2
+        assert "subscriptions" not in result["customer"]
 
-    @patch("database.customer_queries.get_subscriptions_by_customer")
-    @patch("database.customer_queries.lookup_customer")
-    def test_no_active_falls_back(self, mock_lookup, mock_subs):
-        mock_lookup.return_value = SAMPLE_CUSTOMER
-        mock_subs.return_value = [SAMPLE_SUB_INACTIVE]
+    @patch("database.customer_queries.get_client")
+    def test_no_active_falls_back(self, mock_get_client):
+        mock_get_client.return_value = self._client_returning([
+            {**SAMPLE_CUSTOMER, "subscriptions": [SAMPLE_SUB_INACTIVE]},
+        ])
 
         result = get_active_subscription_by_email("test@example.com")
         assert result["subscription"]["status"] == "Inactive"
         assert result["subscriptions_count"] == 1
 
-    @patch("database.customer_queries.get_subscriptions_by_customer")
-    @patch("database.customer_queries.lookup_customer")
-    def test_no_subscriptions(self, mock_lookup, mock_subs):
-        mock_lookup.return_value = SAMPLE_CUSTOMER
-        mock_subs.return_value = []
+    @patch("database.customer_queries.get_client")
+    def test_no_subscriptions(self, mock_get_client):
+        mock_get_client.return_value = self._client_returning([
+            {**SAMPLE_CUSTOMER, "subscriptions": []},
+        ])
 
         result = get_active_subscription_by_email("test@example.com")
         assert result["found"] is True
         assert result["subscription"] is None
         assert result["subscriptions_count"] == 0
 
-    @patch("database.customer_queries.lookup_customer")
-    def test_customer_not_found(self, mock_lookup):
-        mock_lookup.return_value = None
+    @patch("database.customer_queries.get_client")
+    def test_customer_not_found(self, mock_get_client):
+        mock_get_client.return_value = self._client_returning([])
 
         result = get_active_subscription_by_email("unknown@example.com")
         assert result is None
 
+    @patch("database.customer_queries.get_client")
+    def test_single_round_trip(self, mock_get_client):
+        client = self._client_returning([{**SAMPLE_CUSTOMER, "subscriptions": []}])
+        mock_get_client.return_value = client
+
+        get_active_subscription_by_email("Test@Example.com")
+        client.table.assert_called_once_with("customers")
+        client.table.return_value.eq.assert_called_once_with("email", "test@example.com")
+
+
+# --- get_active_subscriptions_by_emails ---
+
+
+class TestGetActiveSubscriptionsByEmails:
+    @patch("database.customer_queries.get_client")
+    def test_single_in_query_keyed_by_email(self, mock_get_client):
+        other = {**SAMPLE_CUSTOMER, "id": 43, "email": "other@example.com"}
+        client = MagicMock()
+        client.table.return_value = _mock_chain(_mock_response([
+            {**SAMPLE_CUSTOMER, "subscriptions": [SAMPLE_SUB_INACTIVE, SAMPLE_SUB_ACTIVE]},
+            {**other, "subscriptions": []},
+        ]))
+        mock_get_client.return_value = client
+
+        result = get_active_subscriptions_by_emails(
+            ["Test@Example.com", "other@example.com", "test@example.com", "missing@example.com"],
+        )
+        client.table.assert_called_once_with("customers")
+        client.table.return_value.in_.assert_called_once_with(
+            "email", ["test@example.com", "other@example.com", "missing@example.com"],
+        )
+        assert set(result) == {"test@example.com", "other@example.com"}
+        assert result["test@example.com"]["subscription"]["status"] == "Active"
+        assert result["other@example.com"]["subscription"] is None
+
+    @patch("database.customer_queries.get_client")
+    def test_empty_input_skips_query(self, mock_get_client):
+        assert get_active_subscriptions_by_emails([]) == {}
+        mock_get_client.assert_not_called()
+
+    @patch("database.customer_queries.get_client")
+    def test_exception_returns_empty(self, mock_get_client):
+        mock_get_client.return_value.table.side_effect = Exception("DB error")
+        assert get_active_subscriptions_by_emails(["test@example.com"]) == {}
+
+
+# --- get_subscription_with_last_order_by_email ---
+
+
+class TestGetSubscriptionWithLastOrderByEmail:
+    @patch("database.customer_queries.get_client")
+    def test_single_round_trip(self, mock_get_client):
+        row = {
+            **SAMPLE_CUSTOMER,
+            "subscriptions": [SAMPLE_SUB_INACTIVE, SAMPLE_SUB_ACTIVE],
+            "orders": [SAMPLE_ORDER],
+        }
+        client = MagicMock()
+        chain = _mock_chain(_mock_response([row]))
+        client.table.return_value = chain
+        mock_get_client.return_value = client
+
+        result = get_subscription_with_last_order_by_email("Test@Example.com")
+        assert result["customer"]["email"] == "test@example.com"
+        assert "subscriptions" not in result["customer"]
+        assert "orders" not in result["customer"]
+        assert result["subscription"]["status"] == "Active"
+        assert result["subscriptions_count"] == 2
+        assert result["last_order"]["box_name"] == "February 2026 Box"
+        client.table.assert_called_once_with("customers")
+        chain.execute.assert_called_once()
+
+    @patch("database.customer_queries.get_client")
+    def test_no_subscriptions_or_orders(self, mock_get_client):
+        row = {**SAMPLE_CUSTOMER, "subscriptions": [], "orders": []}
+        client = MagicMock()
+        client.table.return_value = _mock_chain(_mock_response([row]))
+        mock_get_client.return_value = client
+
+        result = get_subscription_with_last_order_by_email("test@example.com")
+        assert result["subscription"] is None
+        assert result["subscriptions_count"] == 0
+        assert result["last_order"] is None
+
+    @patch("database.customer_queries.get_client")
+    def test_customer_not_found(self, mock_get_client):
+        client = MagicMock()
+        client.table.return_value = _mock_chain(_mock_response([]))
+        mock_get_client.return_value = client
+
+        assert get_subscription_with_last_order_by_email("unknown@example.com") is None
+
+    @patch("database.customer_queries.get_client")
+    def test_exception_returns_none(self, mock_get_client):
+        mock_get_client.side_effect = RuntimeError("DB down")
+        assert get_subscription_with_last_order_by_email("test@example.com") is None
+
 
 # --- get_orders_by_customer ---
 
@@ -375,3 +487,85 @@ class TestGetCustomerHistoryByEmail:
 
         result = get_customer_history_by_email("unknown@example.com")
         assert result is None
+
+
+# --- In-process query cache ---
+
+
+class TestCustomerQueryCache:
+    @patch("database.customer_queries.get_client")
+    def test_repeat_lookup_served_from_cache(self, mock_get_client):
+        client = MagicMock()
+        client.table.return_value = _mock_chain(_mock_response([SAMPLE_CUSTOMER]))
+        mock_get_client.return_value = client
+
+        first = lookup_customer("Test@Example.com")
+        second = lookup_customer("test@example.com")
+        assert first == second
+        assert client.table.call_count == 1
+
+    @patch("database.customer_queries.get_client")
+    def test_not_found_is_not_cached(self, mock_get_client):
+        client = MagicMock()
+        client.table.return_value = _mock_chain(_mock_response([]))
+        mock_get_client.return_value = client
+
+        lookup_customer("unknown@example.com")
+        lookup_customer("unknown@example.com")
+        assert client.table.call_count == 2
+
+    @patch("database.customer_queries.get_client")
+    def test_invalidate_forces_refetch(self, mock_get_client):
+        client = MagicMock()
+        client.table.return_value = _mock_chain(_mock_response([SAMPLE_CUSTOMER]))
+        mock_get_client.return_value = client
+
+        lookup_customer("test@example.com")
+        invalidate_customer_cache("TEST@example.com")
+        lookup_customer("test@example.com")
+        assert client.table.call_count == 2
+
+    @patch("database.customer_queries.get_client")
+    def test_concurrent_misses_query_once(self, mock_get_client):
+        calls = 0
+        calls_lock = threading.Lock()
+
+        def slow_execute():
+            nonlocal calls
+            with calls_lock:
+                calls += 1
+            time.sleep(0.05)
+            return _mock_response([SAMPLE_CUSTOMER])
+
+        chain = _mock_chain(None)
+        chain.execute.side_effect = slow_execute
+        mock_get_client.return_value.table.return_value = chain
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lookup_customer, ["test@example.com"] * 8))
+        assert all(r == SAMPLE_CUSTOMER for r in results)
+        assert calls == 1
+
+
+class TestTTLCache:
+    def test_expired_entry_dropped(self):
+        cache = TTLCache(max_size=10, ttl_seconds=60)
+        with patch("database.cache.time.monotonic", return_value=0):
+            cache.set(("fn", "a@example.com"), {"id": 1})
+        with patch("database.cache.time.monotonic", return_value=61):
+            assert cache.get(("fn", "a@example.com")) is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(max_size=2, ttl_seconds=60)
+        cache.set(("fn", "a"), 1)
+        cache.set(("fn", "b"), 2)
+        cache.get(("fn", "a"))
+        cache.set(("fn", "c"), 3)
+        assert cache.get(("fn", "b")) is None
+        assert cache.get(("fn", "a")) == 1
+
+    def test_zero_ttl_disables(self):
+        cache = TTLCache(max_size=10, ttl_seconds=0)
+        cache.set(("fn", "a"), 1)
+        assert cache.get(("fn", "a")) is None
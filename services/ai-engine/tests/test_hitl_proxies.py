@@ -0,0 +1,38 @@
+"""Unit tests for tools/hitl_proxies.py (CopilotKit pending-confirmation stubs)."""
+
+import json
+
+import pytest
+
+from tools import hitl_proxies
+
+
+class TestPendingConfirmation:
+    @pytest.mark.asyncio
+    async def test_pause_subscription(self):
+        result = json.loads(await hitl_proxies.pause_subscription("test@example.com", 3))
+        assert result == {
+            "status": "pending_confirmation",
+            "tool": "pause_subscription",
+            "customer_email": "test@example.com",
+            "duration_months": 3,
+            "message": "A confirmation form has been shown to the customer. "
+                       "They need to review and confirm the pause.",
+        }
+
+    @pytest.mark.asyncio
+    async def test_damage_claim_fields(self):
+        result = json.loads(
+            await hitl_proxies.create_damage_claim("test@example.com", "olive oil", "cracked"),
+        )
+        assert result["tool"] == "create_damage_claim"
+        assert result["item_description"] == "olive oil"
+        assert result["damage_description"] == "cracked"
+        assert result["message"].endswith("confirm the damage claim.")
+
+    @pytest.mark.asyncio
+    async def test_escapes_dynamic_fields(self):
+        address = 'Rehov "HaShalom" 5, Tel Aviv'
+        result = json.loads(await hitl_proxies.change_address("test@example.com", address))
+        assert result["new_address"] == address
+        assert list(result)[-1] == "message"
@@ -0,0 +1,115 @@
+"""Unit tests for tools/retention.py (cancel link generation + injection)."""
+
+import base64
+import hashlib
+import json
+import os
+from unittest.mock import patch
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from tools.retention import (
+    CANCEL_BASE_URL,
+    _encode_token,
+    _next_nonce,
+    generate_cancel_link,
+    inject_cancel_link,
+)
+
+PASSWORD = "test-cancel-password"
+
+
+def _decrypt(url: str, password: str = PASSWORD) -> dict:
+    """Decode a cancel URL token back into its JSON payload."""
+    token = url.split("?al=", 1)[1]
+    raw = base64.urlsafe_b64decode(token)
+    key = hashlib.sha256(password.encode()).digest()
+    plaintext = AESGCM(key).decrypt(raw[:12], raw[12:], None)
+    return json.loads(plaintext)
+
+
+class TestGenerateCancelLink:
+    @patch("tools.retention.settings")
+    def test_round_trip(self, mock_settings):
+        mock_settings.cancel_link_password = PASSWORD
+        url = generate_cancel_link("sub_123", "test@example.com")
+        assert url.startswith(f"{CANCEL_BASE_URL}?al=")
+        assert _decrypt(url) == {"subscription_id": "sub_123", "email": "test@example.com"}
+
+    @patch("tools.retention.settings")
+    def test_unique_tokens(self, mock_settings):
+        mock_settings.cancel_link_password = PASSWORD
+        first = generate_cancel_link("sub_123", "test@example.com")
+        second = generate_cancel_link("sub_123", "test@example.com")
+        assert first != second
+
+    @patch("tools.retention.settings")
+    def test_password_change_uses_new_key(self, mock_settings):
+        mock_settings.cancel_link_password = PASSWORD
+        generate_cancel_link("sub_123", "test@example.com")
+        mock_settings.cancel_link_password = "rotated-password"
+        url = generate_cancel_link("sub_123", "test@example.com")
+        assert _decrypt(url, "rotated-password")["subscription_id"] == "sub_123"
+
+    @patch("tools.retention.settings")
+    def test_no_password_returns_none(self, mock_settings):
+        mock_settings.cancel_link_password = ""
+        assert generate_cancel_link("sub_123", "test@example.com") is None
+
+
+class TestInjectCancelLink:
+    URL = f"{CANCEL_BASE_URL}?al=abc123"
+
+    def test_bracket_placeholder(self):
+        result = inject_cancel_link("Cancel here: [CANCEL_LINK]", self.URL)
+        assert result == f"Cancel here: {self.URL}"
+
+    def test_brace_placeholder(self):
+        result = inject_cancel_link("Cancel here: {cancel_link}", self.URL)
+        assert result == f"Cancel here: {self.URL}"
+
+    def test_double_brace_placeholder(self):
+        result = inject_cancel_link("Cancel here: {{cancel_link}}", self.URL)
+        assert result == f"Cancel here: {self.URL}"
+
+    def test_placeholder_skips_generic_mention(self):
+        result = inject_cancel_link("Use the cancel page: [CANCEL_LINK]", self.URL)
+        assert result == f"Use the cancel page: {self.URL}"
+
+    def test_generic_mention_linked_once(self):
+        result = inject_cancel_link(
+            "Visit the Cancellation Page. The cancel page is simple.", self.URL,
+        )
+        assert result.count(f'<a href="{self.URL}">') == 1
+
+    def test_no_mention_unchanged(self):
+        text = "We are sorry to see you go."
+        assert inject_cancel_link(text, self.URL) == text
+
+
+class TestNextNonce:
+    def test_length_and_uniqueness(self):
+        nonces = {_next_nonce() for _ in range(1000)}
+        assert len(nonces) == 1000
+        assert all(len(n) == 12 for n in nonces)
+
+    def test_not_shared_across_fork(self):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, _next_nonce())
+            os._exit(0)
+        os.close(write_fd)
+        child_nonce = os.read(read_fd, 12)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        assert len(child_nonce) == 12
+        assert child_nonce != _next_nonce()
+
+
+class TestEncodeToken:
+    def test_urlsafe_alphabet(self):
+        token = _encode_token(b"\xff" * 12, b"\xfb\xef" * 20)
+        assert "+" not in token and "/" not in token
+        assert base64.urlsafe_b64decode(token) == b"\xff" * 12 + b"\xfb\xef" * 20
@@ -0,0 +1,98 @@
+"""Unit tests for tools/common.py (shared tool helpers)."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from tools.common import (
+    NOT_FOUND_MESSAGE,
+    batched_tool_logs,
+    customer_not_found,
+    log_tool_call,
+    normalize_email,
+    to_json,
+)
+
+
+class TestNormalizeEmail:
+    def test_strips_and_lowercases(self):
+        assert normalize_email("  Foo.Bar@Example.COM ") == "foo.bar@example.com"
+
+    def test_idempotent(self):
+        assert normalize_email("foo@example.com") == "foo@example.com"
+
+
+class TestToJson:
+    def test_returns_str_round_trip(self):
+        payload = {"status": "completed", "price": 54.9, "name": "Ré", "tags": [1, None]}
+        result = to_json(payload)
+        assert isinstance(result, str)
+        assert json.loads(result) == payload
+
+
+class TestCustomerNotFound:
+    def test_matches_json_dumps(self):
+        expected = json.dumps({
+            "found": False,
+            "customer_email": "foo@example.com",
+            "message": NOT_FOUND_MESSAGE,
+        })
+        assert customer_not_found("foo@example.com") == expected
+
+    def test_custom_message(self):
+        body = json.loads(customer_not_found("a@b.com", "Customer with this email not found."))
+        assert body == {
+            "found": False,
+            "customer_email": "a@b.com",
+            "message": "Customer with this email not found.",
+        }
+
+    def test_non_ascii_email(self):
+        body = json.loads(customer_not_found("josé@exámple.com"))
+        assert body["customer_email"] == "josé@exámple.com"
+
+    def test_escapes_email(self):
+        body = json.loads(customer_not_found('a"b\\c@x.com'))
+        assert body["customer_email"] == 'a"b\\c@x.com'
+
+
+class TestToolCallLogging:
+    @patch("tools.common.logger")
+    def test_logs_immediately_outside_scope(self, mock_logger):
+        log_tool_call("get_subscription", email="test@example.com")
+        mock_logger.info.assert_called_once_with(
+            "tool_called", tool="get_subscription", email="test@example.com",
+        )
+
+    @patch("tools.common.logger")
+    def test_batches_within_scope(self, mock_logger):
+        with batched_tool_logs(session_id="s1"):
+            log_tool_call("get_subscription", email="a@example.com")
+            log_tool_call("track_package", email="a@example.com")
+            mock_logger.info.assert_not_called()
+
+        mock_logger.info.assert_called_once()
+        args, kwargs = mock_logger.info.call_args
+        assert args == ("tool_calls_batch",)
+        assert kwargs["session_id"] == "s1"
+        assert kwargs["count"] == 2
+        assert [c["tool"] for c in kwargs["calls"]] == ["get_subscription", "track_package"]
+
+    @patch("tools.common.logger")
+    def test_empty_scope_emits_nothing(self, mock_logger):
+        with batched_tool_logs():
+            pass
+        mock_logger.info.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("tools.common.logger")
+    async def test_gathered_tasks_share_buffer(self, mock_logger):
+        async def _tool(name):
+            log_tool_call(name)
+
+        with batched_tool_logs():
+            await asyncio.gather(_tool("a"), _tool("b"))
+
+        assert mock_logger.info.call_args.kwargs["count"] == 2
@@ -19,7 +19,7 @@ class TestToolRegistry:
             assert callable(fn), f"Tool '{name}' is not callable"
 
     def test_registry_has_expected_count(self):
-        assert len(TOOL_REGISTRY) == 12
+        assert len(TOOL_REGISTRY) == 13
 
 
 class TestResolveTools:
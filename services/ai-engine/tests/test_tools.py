@@ -1,19 +1,32 @@
 """Unit tests for action tools.
 
-Read-only tools (customer, shipping, customization) mock the DB query layer.
+Read-only tools (customer, shipping, customization) mock the DB query layer
+and are awaited like the write tools.
 Write tools (subscription, damage) remain stubs and are tested directly.
 """
 
 import json
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from tools.customer import get_customer_history, get_payment_history, get_subscription
+from tools.customer import (
+    MAX_BATCH_EMAILS,
+    get_customer_history,
+    get_payment_history,
+    get_subscription,
+    get_subscriptions,
+)
 from tools.customization import get_box_contents
 from tools.damage import create_damage_claim, request_photos
 from tools.shipping import track_package
-from tools.subscription import change_address, change_frequency, pause_subscription, skip_month
+from tools.subscription import (
+    _parse_address,
+    change_address,
+    change_frequency,
+    pause_subscription,
+    skip_month,
+)
 
 # --- Sample data for mocks ---
 
@@ -85,15 +98,16 @@ SAMPLE_TRACKING = {
 
 
 class TestGetSubscription:
+    @pytest.mark.asyncio
     @patch("tools.customer.get_active_subscription_by_email")
-    def test_found_with_subscription(self, mock_query):
+    async def test_found_with_subscription(self, mock_query):
         mock_query.return_value = {
             "found": True,
             "customer": SAMPLE_CUSTOMER,
             "subscription": SAMPLE_SUB,
             "subscriptions_count": 1,
         }
-        result = json.loads(get_subscription("test@example.com"))
+        result = json.loads(await get_subscription("test@example.com"))
         assert result["found"] is True
         assert result["customer_name"] == "Rebecca Fedak"
         assert result["status"] == "Active"
@@ -103,33 +117,73 @@ class TestGetSubscription:
         assert result["shipping_address"]["city"] == "Brooklyn"
         assert result["no_honey"] is True
 
+    @pytest.mark.asyncio
     @patch("tools.customer.get_active_subscription_by_email")
-    def test_found_no_subscription(self, mock_query):
+    async def test_found_no_subscription(self, mock_query):
         mock_query.return_value = {
             "found": True,
             "customer": SAMPLE_CUSTOMER,
             "subscription": None,
             "subscriptions_count": 0,
         }
-        result = json.loads(get_subscription("test@example.com"))
+        result = json.loads(await get_subscription("test@example.com"))
         assert result["found"] is True
         assert result["subscription"] is None
         assert "no subscriptions" in result["message"]
 
+    @pytest.mark.asyncio
     @patch("tools.customer.get_active_subscription_by_email")
-    def test_not_found(self, mock_query):
+    async def test_not_found(self, mock_query):
         mock_query.return_value = None
-        result = json.loads(get_subscription("unknown@example.com"))
+        result = json.loads(await get_subscription("unknown@example.com"))
         assert result["found"] is False
         assert "verify" in result["message"].lower()
 
+    @pytest.mark.asyncio
+    @patch("tools.customer.get_active_subscription_by_email")
+    async def test_normalizes_email(self, mock_query):
+        mock_query.return_value = None
+        result = json.loads(await get_subscription("  Test@Example.COM "))
+        mock_query.assert_called_once_with("test@example.com")
+        assert result["customer_email"] == "test@example.com"
+
+
+# --- get_subscriptions ---
+
+
+class TestGetSubscriptions:
+    @pytest.mark.asyncio
+    @patch("tools.customer.get_active_subscriptions_by_emails")
+    async def test_keyed_by_email(self, mock_query):
+        mock_query.return_value = {
+            "test@example.com": {
+                "found": True,
+                "customer": SAMPLE_CUSTOMER,
+                "subscription": SAMPLE_SUB,
+                "subscriptions_count": 1,
+            },
+        }
+        result = json.loads(await get_subscriptions(["Test@Example.com", "unknown@example.com"]))
+        mock_query.assert_called_once_with(["test@example.com", "unknown@example.com"])
+        assert result["test@example.com"]["status"] == "Active"
+        assert result["unknown@example.com"]["found"] is False
+
+    @pytest.mark.asyncio
+    @patch("tools.customer.get_active_subscriptions_by_emails")
+    async def test_too_many_emails(self, mock_query):
+        emails = [f"user{i}@example.com" for i in range(MAX_BATCH_EMAILS + 1)]
+        result = json.loads(await get_subscriptions(emails))
+        assert "error" in result
+        mock_query.assert_not_called()
+
 
 # --- get_customer_history ---
 
 
 class TestGetCustomerHistory:
+    @pytest.mark.asyncio
     @patch("tools.customer.get_customer_history_by_email")
-    def test_found(self, mock_query):
+    async def test_found(self, mock_query):
         mock_query.return_value = {
             "found": True,
             "customer": {"email": "test@example.com", "name": "Rebecca"},
@@ -141,14 +195,15 @@ class TestGetCustomerHistory:
             },
             "subscriptions_count": 1,
         }
-        result = json.loads(get_customer_history("test@example.com"))
+        result = json.loads(await get_customer_history("test@example.com"))
         assert result["found"] is True
         assert result["orders_summary"]["total_subscription_boxes"] == 20
 
+    @pytest.mark.asyncio
     @patch("tools.customer.get_customer_history_by_email")
-    def test_not_found(self, mock_query):
+    async def test_not_found(self, mock_query):
         mock_query.return_value = None
-        result = json.loads(get_customer_history("unknown@example.com"))
+        result = json.loads(await get_customer_history("unknown@example.com"))
         assert result["found"] is False
 
 
@@ -156,8 +211,9 @@ class TestGetCustomerHistory:
 
 
 class TestGetPaymentHistory:
+    @pytest.mark.asyncio
     @patch("tools.customer.get_payment_history_by_email")
-    def test_with_payments(self, mock_query):
+    async def test_with_payments(self, mock_query):
         mock_query.return_value = {
             "found": True,
             "customer_email": "test@example.com",
@@ -168,15 +224,16 @@ class TestGetPaymentHistory:
             "payment_method": "card",
             "payment_method_id": "************8534",
         }
-        result = json.loads(get_payment_history("test@example.com"))
+        result = json.loads(await get_payment_history("test@example.com"))
         assert result["found"] is True
         assert len(result["payments"]) == 1
         assert result["next_payment_date"] == "2026-03-01"
 
+    @pytest.mark.asyncio
     @patch("tools.customer.get_payment_history_by_email")
-    def test_not_found(self, mock_query):
+    async def test_not_found(self, mock_query):
         mock_query.return_value = None
-        result = json.loads(get_payment_history("unknown@example.com"))
+        result = json.loads(await get_payment_history("unknown@example.com"))
         assert result["found"] is False
 
 
@@ -184,8 +241,9 @@ class TestGetPaymentHistory:
 
 
 class TestTrackPackage:
+    @pytest.mark.asyncio
     @patch("tools.shipping.get_tracking_by_email")
-    def test_with_tracking(self, mock_query):
+    async def test_with_tracking(self, mock_query):
         mock_query.return_value = {
             "found": True,
             "customer_email": "test@example.com",
@@ -197,28 +255,30 @@ class TestTrackPackage:
             },
             "tracking": SAMPLE_TRACKING,
         }
-        result = json.loads(track_package("test@example.com"))
+        result = json.loads(await track_package("test@example.com"))
         assert result["found"] is True
         assert result["tracking_number"] == "LH2026021345IL"
         assert result["delivery_status"] == "in_transit"
         assert len(result["history"]) == 2
 
+    @pytest.mark.asyncio
     @patch("tools.shipping.get_tracking_by_email")
-    def test_no_tracking(self, mock_query):
+    async def test_no_tracking(self, mock_query):
         mock_query.return_value = {
             "found": True,
             "customer_email": "test@example.com",
             "tracking": None,
             "message": "No recent shipment with tracking found.",
         }
-        result = json.loads(track_package("test@example.com"))
+        result = json.loads(await track_package("test@example.com"))
         assert result["found"] is True
         assert result["tracking"] is None
 
+    @pytest.mark.asyncio
     @patch("tools.shipping.get_tracking_by_email")
-    def test_not_found(self, mock_query):
+    async def test_not_found(self, mock_query):
         mock_query.return_value = None
-        result = json.loads(track_package("unknown@example.com"))
+        result = json.loads(await track_package("unknown@example.com"))
         assert result["found"] is False
 
 
@@ -226,18 +286,18 @@ class TestTrackPackage:
 
 
 class TestGetBoxContents:
-    @patch("tools.customization.get_orders_by_customer")
-    @patch("tools.customization.get_active_subscription_by_email")
-    def test_with_data(self, mock_sub, mock_orders):
-        mock_sub.return_value = {
+    @pytest.mark.asyncio
+    @patch("tools.customization.get_subscription_with_last_order_by_email")
+    async def test_with_data(self, mock_query):
+        mock_query.return_value = {
             "found": True,
             "customer": SAMPLE_CUSTOMER,
             "subscription": SAMPLE_SUB,
             "subscriptions_count": 1,
+            "last_order": SAMPLE_ORDER,
         }
-        mock_orders.return_value = [SAMPLE_ORDER]
 
-        result = json.loads(get_box_contents("test@example.com"))
+        result = json.loads(await get_box_contents("test@example.com"))
         assert result["found"] is True
         assert result["last_box"]["box_name"] == "February 2026 Box"
         assert result["customization_preferences"]["no_honey"] is True
@@ -245,25 +305,26 @@ class TestGetBoxContents:
         assert "honey" in result["customization_preferences"]["current"]
         assert "alcohol" not in result["customization_preferences"]["current"]
 
-    @patch("tools.customization.get_orders_by_customer")
-    @patch("tools.customization.get_active_subscription_by_email")
-    def test_no_orders(self, mock_sub, mock_orders):
-        mock_sub.return_value = {
+    @pytest.mark.asyncio
+    @patch("tools.customization.get_subscription_with_last_order_by_email")
+    async def test_no_orders(self, mock_query):
+        mock_query.return_value = {
             "found": True,
             "customer": SAMPLE_CUSTOMER,
             "subscription": SAMPLE_SUB,
             "subscriptions_count": 1,
+            "last_order": None,
         }
-        mock_orders.return_value = []
 
-        result = json.loads(get_box_contents("test@example.com"))
+        result = json.loads(await get_box_contents("test@example.com"))
         assert result["found"] is True
         assert result["last_box"]["box_name"] is None
 
-    @patch("tools.customization.get_active_subscription_by_email")
-    def test_not_found(self, mock_sub):
-        mock_sub.return_value = None
-        result = json.loads(get_box_contents("unknown@example.com"))
+    @pytest.mark.asyncio
+    @patch("tools.customization.get_subscription_with_last_order_by_email")
+    async def test_not_found(self, mock_query):
+        mock_query.return_value = None
+        result = json.loads(await get_box_contents("unknown@example.com"))
         assert result["found"] is False
 
 
@@ -288,6 +349,25 @@ class TestChangeFrequency:
         assert result["customer_email"] == "test@example.com"
         assert result["new_frequency"] == "quarterly"
 
+    @pytest.mark.asyncio
+    @patch("tools.subscription.lookup_customer")
+    async def test_unknown_customer(self, mock_lookup):
+        mock_lookup.return_value = None
+        result = json.loads(await change_frequency("unknown@example.com", "quarterly"))
+        assert result["found"] is False
+        assert "verify the email" in result["message"]
+
+    @pytest.mark.asyncio
+    @patch("tools.subscription.invalidate_customer_cache")
+    @patch("tools.subscription.APIFactory.get_subscription_api")
+    @patch("tools.subscription.lookup_customer")
+    async def test_api_failure(self, mock_lookup, mock_api, mock_invalidate):
+        mock_lookup.return_value = SAMPLE_CUSTOMER
+        mock_api.return_value.change_frequency = AsyncMock(return_value={"success": False})
+        result = json.loads(await change_frequency("test@example.com", "quarterly"))
+        assert result == {"status": "error", "message": "Failed to update frequency"}
+        mock_invalidate.assert_not_called()
+
 
 class TestSkipMonth:
     @pytest.mark.asyncio
@@ -347,6 +427,29 @@ class TestChangeAddress:
         assert "new_address" in result or "validated" in result
 
 
+class TestParseAddress:
+    def test_three_parts(self):
+        assert _parse_address(" 12 Herzl St , Haifa,  Israel ") == {
+            "street": "12 Herzl St",
+            "city": "Haifa",
+            "country": "Israel",
+        }
+
+    def test_missing_country_defaults(self):
+        assert _parse_address("12 Herzl St, Haifa") == {
+            "street": "12 Herzl St",
+            "city": "Haifa",
+            "country": "Israel",
+        }
+
+    def test_street_only(self):
+        assert _parse_address("12 Herzl St")["city"] == ""
+
+    def test_dict_passes_through(self):
+        address = {"street": "1 Main St", "city": "Boston", "country": "US"}
+        assert _parse_address(address) is address
+
+
 class TestCreateDamageClaim:
     @pytest.mark.asyncio
     @patch("tools.damage.lookup_customer")
@@ -364,6 +467,16 @@ class TestCreateDamageClaim:
         assert "next_steps" in result or "photo" in result.get("claim_status", "").lower()
 
 
+    @pytest.mark.asyncio
+    @patch("tools.damage.APIFactory")
+    @patch("tools.damage.lookup_customer")
+    async def test_unknown_customer_skips_api(self, mock_lookup, mock_factory):
+        mock_lookup.return_value = None
+        result = json.loads(await create_damage_claim("unknown@example.com", "soap", "melted"))
+        assert result["found"] is False
+        mock_factory.get_damage_claim_api.assert_not_called()
+
+
 class TestRequestPhotos:
     @pytest.mark.asyncio
     @patch("tools.damage.lookup_customer")
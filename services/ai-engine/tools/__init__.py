@@ -3,11 +3,20 @@
 TOOL_REGISTRY maps string tool names (from CATEGORY_CONFIG) to
 callable functions. resolve_tools() converts a list of string
 names into a list of callables for the Agno Agent.
+
+Tools return JSON strings rather than dicts: Agno hands a tool's return
+value to the model via str(), so a string is serialized exactly once,
+while a dict would reach the model as a Python repr.
 """
 
 import structlog
 
-from tools.customer import get_customer_history, get_payment_history, get_subscription
+from tools.customer import (
+    get_customer_history,
+    get_payment_history,
+    get_subscription,
+    get_subscriptions,
+)
 from tools.customization import get_box_contents
 from tools.damage import create_damage_claim, request_photos
 from tools import hitl_proxies
@@ -19,6 +28,7 @@ logger = structlog.get_logger()
 
 TOOL_REGISTRY: dict[str, callable] = {
     "get_subscription": get_subscription,
+    "get_subscriptions": get_subscriptions,
     "get_customer_history": get_customer_history,
     "get_payment_history": get_payment_history,
     "track_package": track_package,
@@ -0,0 +1,103 @@
+"""Shared helpers for tool functions.
+
+Email normalization: tools lowercase/strip customer_email once at
+entry so DB lookups (emails are stored lowercase) and cache keys see
+one canonical form.
+
+Tool-call logging: when an agent turn opens a batched_tool_logs()
+scope, each tool call is buffered in a contextvar and emitted as one
+"tool_calls_batch" event at the end of the turn instead of one log
+event per call. Outside such a scope, calls are logged immediately.
+
+Serialization: to_json() encodes tool payloads with orjson, which is
+several times faster than stdlib json on the small dicts tools return.
+
+Not-found responses: every tool answers an unknown email with the same
+JSON shape; the static part of each body is serialized once and only
+the email is escaped per call.
+"""
+
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Iterator
+
+import orjson
+import structlog
+
+logger = structlog.get_logger()
+
+NOT_FOUND_MESSAGE = (
+    "No customer found with this email. "
+    "Please ask the customer to verify their email address."
+)
+
+_tool_calls: ContextVar[list[dict[str, Any]] | None] = ContextVar("tool_calls", default=None)
+
+
+def normalize_email(email: str) -> str:
+    """Return the canonical (stripped, lowercase) form of an email."""
+    return email.strip().lower()
+
+
+def to_json(payload: Any) -> str:
+    """Serialize a tool payload to a JSON string with orjson."""
+    return orjson.dumps(payload).decode()
+
+
+@lru_cache(maxsize=8)
+def _not_found_tail(message: str) -> str:
+    """Serialize the static '"message": ...}' tail of a not-found body."""
+    return json.dumps({"message": message})[1:]
+
+
+def customer_not_found(customer_email: str, message: str = NOT_FOUND_MESSAGE) -> str:
+    """Build the JSON body returned when no customer matches an email.
+
+    Same document as json.dumps({"found": False, "customer_email": ...,
+    "message": ...}); the static tail is cached per message and only
+    the email is escaped per call (with orjson).
+
+    Args:
+        customer_email: The (normalized) email that was looked up.
+        message: Instruction for the agent, defaults to NOT_FOUND_MESSAGE.
+
+    Returns:
+        JSON string.
+    """
+    return f'{{"found": false, "customer_email": {orjson.dumps(customer_email).decode()}, {_not_found_tail(message)}'
+
+
+def log_tool_call(tool: str, **fields: Any) -> None:
+    """Record a tool invocation (buffered if inside a turn scope).
+
+    Args:
+        tool: Tool name.
+        **fields: Structured fields to log (email, arguments, ...).
+    """
+    calls = _tool_calls.get()
+    if calls is None:
+        logger.info("tool_called", tool=tool, **fields)
+    else:
+        calls.append({"tool": tool, **fields})
+
+
+@contextmanager
+def batched_tool_logs(**context: Any) -> Iterator[None]:
+    """Buffer tool-call logs for one agent turn and flush them once.
+
+    Tasks spawned inside the scope (asyncio.gather, to_thread) copy the
+    context and therefore append to the same buffer.
+
+    Args:
+        **context: Fields attached to the batch event (session_id, ...).
+    """
+    calls: list[dict[str, Any]] = []
+    token = _tool_calls.set(calls)
+    try:
+        yield
+    finally:
+        _tool_calls.reset(token)
+        if calls:
+            logger.info("tool_calls_batch", count=len(calls), calls=calls, **context)
@@ -2,65 +2,54 @@
 
 Queries normalized customer tables (customers, subscriptions, orders).
 Returns JSON strings consumed by the Support Agent.
+
+Tools are async: the blocking Supabase queries run in worker threads
+so several tool calls in one agent turn can overlap.
 """
 
+import asyncio
 import json
 
-import structlog
-
 from database.customer_queries import (
     get_active_subscription_by_email,
+    get_active_subscriptions_by_emails,
     get_customer_history_by_email,
     get_payment_history_by_email,
 )
+from tools.common import (
+    NOT_FOUND_MESSAGE,
+    customer_not_found,
+    log_tool_call,
+    normalize_email,
+)
 
-logger = structlog.get_logger()
-
-
-def get_subscription(customer_email: str) -> str:
-    """Look up a customer's active subscription by email address.
-
-    Use this tool when you need to know the customer's subscription plan,
-    status, shipping address, or billing details to answer their question.
-
-    Args:
-        customer_email: The customer's email address.
 
-    Returns:
-        JSON string with subscription details including plan, status,
-        next billing date, shipping address, and subscription ID.
-    """
-    logger.info("tool_called", tool="get_subscription", email=customer_email)
+MAX_BATCH_EMAILS = 50
 
-    result = get_active_subscription_by_email(customer_email)
-    if not result:
-        return json.dumps({
-            "found": False,
-            "customer_email": customer_email,
-            "message": "No customer found with this email. Please ask the customer to verify their email address.",
-        })
 
+def _format_subscription(result: dict) -> dict:
+    """Shape a subscription query result into the tool response."""
     customer = result["customer"]
     sub = result.get("subscription")
 
     if not sub:
-        return json.dumps({
+        return {
             "found": True,
             "customer_email": customer["email"],
             "customer_name": customer.get("name"),
             "subscription": None,
             "subscriptions_count": 0,
             "message": "Customer found but has no subscriptions on record.",
-        })
+        }
 
-    return json.dumps({
+    return {
         "found": True,
         "customer_email": customer["email"],
         "customer_name": customer.get("name"),
         "customer_number": sub.get("customer_number"),
         "status": sub.get("status", "Unknown"),
         "frequency": sub.get("frequency", "Monthly"),
-        "price": float(sub["regular_box_price"]) if sub.get("regular_box_price") else None,
+        "price": float(price) if (price := sub.get("regular_box_price")) else None,
         "price_currency": sub.get("price_currency", "USD"),
         "next_billing_date": sub.get("next_payment_date"),
         "billing_day": sub.get("billing_day"),
@@ -81,10 +70,64 @@ def get_subscription(customer_email: str) -> str:
         "payer_name": sub.get("payer_name"),
         "payer_email": sub.get("payer_email"),
         "subscriptions_count": result["subscriptions_count"],
+    }
+
+
+async def get_subscription(customer_email: str) -> str:
+    """Look up a customer's active subscription by email address.
+
+    Use this tool when you need to know the customer's subscription plan,
+    status, shipping address, or billing details to answer their question.
+
+    Args:
+        customer_email: The customer's email address.
+
+    Returns:
+        JSON string with subscription details including plan, status,
+        next billing date, shipping address, and subscription ID.
+    """
+    customer_email = normalize_email(customer_email)
+    log_tool_call("get_subscription", email=customer_email)
+
+    result = await asyncio.to_thread(get_active_subscription_by_email, customer_email)
+    if not result:
+        return customer_not_found(customer_email)
+
+    return json.dumps(_format_subscription(result))
+
+
+async def get_subscriptions(customer_emails: list[str]) -> str:
+    """Look up active subscriptions for several customers at once.
+
+    Use this tool instead of calling get_subscription repeatedly when
+    you need subscription details for a list of customers.
+
+    Args:
+        customer_emails: Customer email addresses (up to 50).
+
+    Returns:
+        JSON object keyed by email; each value has the same fields as
+        get_subscription, or found=false for unknown emails.
+    """
+    emails = list(dict.fromkeys(normalize_email(e) for e in customer_emails))
+    if len(emails) > MAX_BATCH_EMAILS:
+        return json.dumps({
+            "error": f"Too many emails: at most {MAX_BATCH_EMAILS} per call.",
+        })
+    log_tool_call("get_subscriptions", emails=emails)
+
+    results = await asyncio.to_thread(get_active_subscriptions_by_emails, emails)
+    return json.dumps({
+        email: (
+            _format_subscription(results[email])
+            if email in results
+            else {"found": False, "customer_email": email, "message": NOT_FOUND_MESSAGE}
+        )
+        for email in emails
     })
 
 
-def get_customer_history(customer_email: str) -> str:
+async def get_customer_history(customer_email: str) -> str:
     """Look up a customer's support interaction history.
 
     Use this tool for retention cases to understand the customer's past
@@ -98,20 +141,17 @@ def get_customer_history(customer_email: str) -> str:
         JSON string with past orders, subscription tenure,
         and order history summary.
     """
-    logger.info("tool_called", tool="get_customer_history", email=customer_email)
+    customer_email = normalize_email(customer_email)
+    log_tool_call("get_customer_history", email=customer_email)
 
-    result = get_customer_history_by_email(customer_email)
+    result = await asyncio.to_thread(get_customer_history_by_email, customer_email)
     if not result:
-        return json.dumps({
-            "found": False,
-            "customer_email": customer_email,
-            "message": "No customer found with this email. Please ask the customer to verify their email address.",
-        })
+        return customer_not_found(customer_email)
 
     return json.dumps(result)
 
 
-def get_payment_history(customer_email: str, months: int = 6) -> str:
+async def get_payment_history(customer_email: str, months: int = 6) -> str:
     """Look up a customer's recent payment history.
 
     Use this tool when the customer asks about charges, billing dates,
@@ -125,14 +165,11 @@ def get_payment_history(customer_email: str, months: int = 6) -> str:
         JSON string with recent payments including dates, amounts,
         and payment status.
     """
-    logger.info("tool_called", tool="get_payment_history", email=customer_email, months=months)
+    customer_email = normalize_email(customer_email)
+    log_tool_call("get_payment_history", email=customer_email, months=months)
 
-    result = get_payment_history_by_email(customer_email, months=months)
+    result = await asyncio.to_thread(get_payment_history_by_email, customer_email, months=months)
     if not result:
-        return json.dumps({
-            "found": False,
-            "customer_email": customer_email,
-            "message": "No customer found with this email. Please ask the customer to verify their email address.",
-        })
+        return customer_not_found(customer_email)
 
     return json.dumps(result)
@@ -5,19 +5,19 @@ Detailed box contents are not available in the current data;
 returns subscription preferences and last order info.
 """
 
+import asyncio
 import json
 
-import structlog
+from database.customer_queries import get_subscription_with_last_order_by_email
+from tools.common import customer_not_found, log_tool_call, normalize_email
 
-from database.customer_queries import (
-    get_active_subscription_by_email,
-    get_orders_by_customer,
-)
+# Static parts of the response, allocated once at import.
+_EXCLUSION_FLAGS = (("alcohol", "no_alcohol"), ("honey", "no_honey"))
+_AVAILABLE_EXCLUSIONS = tuple(name for name, _ in _EXCLUSION_FLAGS)
+_CUSTOMIZATION_NOTE = "Customization preferences can be updated. Changes take effect from the next box."
 
-logger = structlog.get_logger()
 
-
-def get_box_contents(customer_email: str) -> str:
+async def get_box_contents(customer_email: str) -> str:
     """Look up a customer's box customization preferences and recent orders.
 
     Use this tool when a customer asks about what items are in their box,
@@ -31,45 +31,32 @@ def get_box_contents(customer_email: str) -> str:
         JSON string with customization preferences (no_alcohol, no_honey),
         last order info, and available exclusion options.
     """
-    logger.info("tool_called", tool="get_box_contents", email=customer_email)
+    customer_email = normalize_email(customer_email)
+    log_tool_call("get_box_contents", email=customer_email)
 
-    result = get_active_subscription_by_email(customer_email)
+    result = await asyncio.to_thread(get_subscription_with_last_order_by_email, customer_email)
     if not result:
-        return json.dumps({
-            "found": False,
-            "customer_email": customer_email,
-            "message": "No customer found with this email. Please ask the customer to verify their email address.",
-        })
+        return customer_not_found(customer_email)
 
     customer = result["customer"]
-    sub = result.get("subscription")
-
-    # Get last order for box info
-    orders = get_orders_by_customer(customer["id"], limit=1)
-    last_order = orders[0] if orders else None
-
-    current_exclusions = []
-    if sub:
-        if sub.get("no_alcohol"):
-            current_exclusions.append("alcohol")
-        if sub.get("no_honey"):
-            current_exclusions.append("honey")
+    sub = result.get("subscription") or {}
+    last_order = result.get("last_order") or {}
 
     return json.dumps({
         "found": True,
         "customer_email": customer["email"],
         "last_box": {
-            "box_name": last_order.get("box_name") if last_order else None,
-            "box_sequence": last_order.get("box_sequence") if last_order else None,
-            "sku": last_order.get("sku") if last_order else None,
-            "shipping_date": last_order.get("shipping_date") if last_order else None,
+            "box_name": last_order.get("box_name"),
+            "box_sequence": last_order.get("box_sequence"),
+            "sku": last_order.get("sku"),
+            "shipping_date": last_order.get("shipping_date"),
             "detailed_contents_available": False,
         },
         "customization_preferences": {
-            "current": current_exclusions,
-            "no_alcohol": sub.get("no_alcohol", False) if sub else False,
-            "no_honey": sub.get("no_honey", False) if sub else False,
-            "available_exclusions": ["alcohol", "honey"],
-            "note": "Customization preferences can be updated. Changes take effect from the next box.",
+            "current": [name for name, flag in _EXCLUSION_FLAGS if sub.get(flag)],
+            "no_alcohol": sub.get("no_alcohol", False),
+            "no_honey": sub.get("no_honey", False),
+            "available_exclusions": _AVAILABLE_EXCLUSIONS,
+            "note": _CUSTOMIZATION_NOTE,
         },
     })
@@ -4,14 +4,12 @@ Phase 2: Uses Mock APIs to return realistic damage claim results.
 Tools for creating damage claims and requesting photo evidence.
 """
 
+import asyncio
 import json
 
-import structlog
-
 from database.customer_queries import lookup_customer
 from mock_apis.factory import APIFactory
-
-logger = structlog.get_logger()
+from tools.common import customer_not_found, log_tool_call, normalize_email
 
 
 async def create_damage_claim(
@@ -33,16 +31,15 @@ async def create_damage_claim(
     Returns:
         JSON string with claim ID, status, and next steps.
     """
-    logger.info("tool_called", tool="create_damage_claim", email=customer_email, item=item_description)
+    customer_email = normalize_email(customer_email)
+    log_tool_call("create_damage_claim", email=customer_email, item=item_description)
 
-    # 1. Verify customer exists
-    customer = lookup_customer(customer_email)
+    # 1. Verify customer exists (off the event loop). Not overlapped with
+    # the API call: both API calls are writes and must not run for
+    # unknown customers.
+    customer = await asyncio.to_thread(lookup_customer, customer_email)
     if not customer:
-        return json.dumps({
-            "found": False,
-            "customer_email": customer_email,
-            "message": "Customer with this email not found.",
-        })
+        return customer_not_found(customer_email, "Customer with this email not found.")
 
     # 2. Call API
     api = APIFactory.get_damage_claim_api()
@@ -84,16 +81,13 @@ async def request_photos(
     Returns:
         JSON string with photo upload instructions.
     """
-    logger.info("tool_called", tool="request_photos", email=customer_email, claim_id=claim_id)
+    customer_email = normalize_email(customer_email)
+    log_tool_call("request_photos", email=customer_email, claim_id=claim_id)
 
-    # 1. Verify customer exists
-    customer = lookup_customer(customer_email)
+    # 1. Verify customer exists (off the event loop)
+    customer = await asyncio.to_thread(lookup_customer, customer_email)
     if not customer:
-        return json.dumps({
-            "found": False,
-            "customer_email": customer_email,
-            "message": "Customer with this email not found.",
-        })
+        return customer_not_found(customer_email, "Customer with this email not found.")
 
     # 2. Call API
     api = APIFactory.get_damage_claim_api()
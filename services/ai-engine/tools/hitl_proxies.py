@@ -14,8 +14,39 @@ import json
 
 import structlog
 
+from tools.common import normalize_email
+
 logger = structlog.get_logger()
 
+_PENDING_MESSAGE = (
+    "A confirmation form has been shown to the customer. "
+    "They need to review and confirm the {action}."
+)
+
+# Static per-tool messages, built once at import instead of per call.
+_MESSAGES: dict[str, str] = {
+    "pause_subscription": _PENDING_MESSAGE.format(action="pause"),
+    "skip_month": _PENDING_MESSAGE.format(action="skip"),
+    "change_frequency": _PENDING_MESSAGE.format(action="frequency change"),
+    "change_address": _PENDING_MESSAGE.format(action="address change"),
+    "create_damage_claim": _PENDING_MESSAGE.format(action="damage claim"),
+}
+
+# Serialized '"message": ...' tail per tool, spliced after the dynamic fields.
+_MESSAGE_TAILS: dict[str, str] = {
+    tool: json.dumps({"message": message})[1:] for tool, message in _MESSAGES.items()
+}
+
+
+def _pending_confirmation(tool: str, **fields) -> str:
+    """Render the pending_confirmation payload for a HITL proxy tool.
+
+    Only the customer-specific fields are serialized per call; the
+    static message is pre-serialized at import time.
+    """
+    head = json.dumps({"status": "pending_confirmation", "tool": tool, **fields})
+    return f"{head[:-1]}, {_MESSAGE_TAILS[tool]}"
+
 
 async def pause_subscription(customer_email: str, duration_months: int = 1) -> str:
     """Pause customer subscription for specified duration.
@@ -30,14 +61,13 @@ async def pause_subscription(customer_email: str, duration_months: int = 1) -> s
     Returns:
         JSON string indicating confirmation is pending.
     """
+    customer_email = normalize_email(customer_email)
     logger.info("hitl_proxy_called", tool="pause_subscription", email=customer_email, months=duration_months)
-    return json.dumps({
-        "status": "pending_confirmation",
-        "tool": "pause_subscription",
-        "customer_email": customer_email,
-        "duration_months": duration_months,
-        "message": "A confirmation form has been shown to the customer. They need to review and confirm the pause.",
-    })
+    return _pending_confirmation(
+        "pause_subscription",
+        customer_email=customer_email,
+        duration_months=duration_months,
+    )
 
 
 async def skip_month(customer_email: str, month: str = "next") -> str:
@@ -53,14 +83,13 @@ async def skip_month(customer_email: str, month: str = "next") -> str:
     Returns:
         JSON string indicating confirmation is pending.
     """
+    customer_email = normalize_email(customer_email)
     logger.info("hitl_proxy_called", tool="skip_month", email=customer_email, month=month)
-    return json.dumps({
-        "status": "pending_confirmation",
-        "tool": "skip_month",
-        "customer_email": customer_email,
-        "month": month,
-        "message": "A confirmation form has been shown to the customer. They need to review and confirm the skip.",
-    })
+    return _pending_confirmation(
+        "skip_month",
+        customer_email=customer_email,
+        month=month,
+    )
 
 
 async def change_frequency(customer_email: str, new_frequency: str) -> str:
@@ -76,14 +105,13 @@ async def change_frequency(customer_email: str, new_frequency: str) -> str:
     Returns:
         JSON string indicating confirmation is pending.
     """
+    customer_email = normalize_email(customer_email)
     logger.info("hitl_proxy_called", tool="change_frequency", email=customer_email, freq=new_frequency)
-    return json.dumps({
-        "status": "pending_confirmation",
-        "tool": "change_frequency",
-        "customer_email": customer_email,
-        "new_frequency": new_frequency,
-        "message": "A confirmation form has been shown to the customer. They need to review and confirm the frequency change.",
-    })
+    return _pending_confirmation(
+        "change_frequency",
+        customer_email=customer_email,
+        new_frequency=new_frequency,
+    )
 
 
 async def change_address(customer_email: str, new_address: str) -> str:
@@ -99,14 +127,13 @@ async def change_address(customer_email: str, new_address: str) -> str:
     Returns:
         JSON string indicating confirmation is pending.
     """
+    customer_email = normalize_email(customer_email)
     logger.info("hitl_proxy_called", tool="change_address", email=customer_email)
-    return json.dumps({
-        "status": "pending_confirmation",
-        "tool": "change_address",
-        "customer_email": customer_email,
-        "new_address": new_address,
-        "message": "A confirmation form has been shown to the customer. They need to review and confirm the address change.",
-    })
+    return _pending_confirmation(
+        "change_address",
+        customer_email=customer_email,
+        new_address=new_address,
+    )
 
 
 async def create_damage_claim(
@@ -127,12 +154,11 @@ async def create_damage_claim(
     Returns:
         JSON string indicating confirmation is pending.
     """
+    customer_email = normalize_email(customer_email)
     logger.info("hitl_proxy_called", tool="create_damage_claim", email=customer_email, item=item_description)
-    return json.dumps({
-        "status": "pending_confirmation",
-        "tool": "create_damage_claim",
-        "customer_email": customer_email,
-        "item_description": item_description,
-        "damage_description": damage_description,
-        "message": "A confirmation form has been shown to the customer. They need to review and confirm the damage claim.",
-    })
+    return _pending_confirmation(
+        "create_damage_claim",
+        customer_email=customer_email,
+        item_description=item_description,
+        damage_description=damage_description,
+    )
@@ -5,9 +5,11 @@ URL: https://levhaolam.com/pay/subscriptions/cancel?al={token}
 """
 
 import base64
+import hashlib
 import json
 import os
 import re
+from functools import lru_cache
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
@@ -19,6 +21,45 @@ logger = structlog.get_logger()
 
 CANCEL_BASE_URL = "https://levhaolam.com/pay/subscriptions/cancel"
 
+# Explicit placeholders. The double-brace form comes first so it is
+# replaced whole rather than leaving stray braces around the URL.
+_PLACEHOLDER_RE = re.compile(r"\{\{cancel_link\}\}|\[CANCEL_LINK\]|\{cancel_link\}")
+
+# Generic "cancellation page" mentions that get linked when the
+# AI response has no explicit placeholder.
+_CANCEL_MENTION_RE = re.compile(
+    r"(cancellation page|cancel page|cancellation link|cancel link)",
+    re.IGNORECASE,
+)
+
+
+_NONCE_BYTES = 12
+
+
+def _next_nonce() -> bytes:
+    """Return a fresh random 12-byte AES-GCM nonce.
+
+    Drawn from os.urandom on every call so forked workers sharing the
+    same key can never repeat a nonce.
+    """
+    return os.urandom(_NONCE_BYTES)
+
+
+@lru_cache(maxsize=4)
+def _get_cipher(password: str) -> AESGCM:
+    """Derive the 256-bit key (SHA-256 of password) and build the cipher once."""
+    key = hashlib.sha256(password.encode()).digest()
+    return AESGCM(key)
+
+
+def _encode_token(nonce: bytes, ciphertext: bytes) -> str:
+    """Base64url-encode nonce || ciphertext into the URL token.
+
+    Tokens are ~100 bytes, so the stdlib C encoder is already cheap;
+    the output alphabet is pure ASCII, so decode via the ASCII codec.
+    """
+    return base64.urlsafe_b64encode(b"".join((nonce, ciphertext))).decode("ascii")
+
 
 def generate_cancel_link(
     subscription_id: str,
@@ -45,18 +86,12 @@ def generate_cancel_link(
             "email": customer_email,
         })
 
-        # Derive 256-bit key from password (SHA-256)
-        import hashlib
-
-        key = hashlib.sha256(password.encode()).digest()
-
         # Encrypt with AES-256-GCM
-        nonce = os.urandom(12)
-        aesgcm = AESGCM(key)
-        ciphertext = aesgcm.encrypt(nonce, payload.encode(), None)
+        nonce = _next_nonce()
+        ciphertext = _get_cipher(password).encrypt(nonce, payload.encode(), None)
 
         # Combine nonce + ciphertext and base64url-encode
-        token = base64.urlsafe_b64encode(nonce + ciphertext).decode()
+        token = _encode_token(nonce, ciphertext)
 
         url = f"{CANCEL_BASE_URL}?al={token}"
         logger.info(
@@ -83,16 +118,13 @@ def inject_cancel_link(response: str, cancel_url: str) -> str:
     Returns:
         Response with cancel link injected.
     """
-    # Replace explicit placeholders
-    result = response.replace("[CANCEL_LINK]", cancel_url)
-    result = result.replace("{cancel_link}", cancel_url)
-    result = result.replace("{{cancel_link}}", cancel_url)
+    # Replace explicit placeholders in a single scan
+    result, replaced = _PLACEHOLDER_RE.subn(lambda _: cancel_url, response)
 
     # If no placeholder was found, check for generic references
-    if cancel_url not in result:
+    if not replaced and cancel_url not in result:
         # Replace "cancellation page" / "cancel page" mentions with linked version
-        pattern = r'(cancellation page|cancel page|cancellation link|cancel link)'
         replacement = f'<a href="{cancel_url}">cancellation page</a>'
-        result = re.sub(pattern, replacement, result, count=1, flags=re.IGNORECASE)
+        result = _CANCEL_MENTION_RE.sub(replacement, result, count=1)
 
     return result
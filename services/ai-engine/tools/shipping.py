@@ -4,16 +4,14 @@ Queries normalized tracking_events and orders tables.
 Returns JSON strings consumed by the Support Agent.
 """
 
+import asyncio
 import json
 
-import structlog
-
 from database.customer_queries import get_tracking_by_email
-
-logger = structlog.get_logger()
+from tools.common import customer_not_found, log_tool_call, normalize_email
 
 
-def track_package(customer_email: str) -> str:
+async def track_package(customer_email: str) -> str:
     """Track the most recent package shipment for a customer.
 
     Use this tool when a customer asks about their package location,
@@ -26,15 +24,12 @@ def track_package(customer_email: str) -> str:
         JSON string with tracking number, carrier, current status,
         and tracking history.
     """
-    logger.info("tool_called", tool="track_package", email=customer_email)
+    customer_email = normalize_email(customer_email)
+    log_tool_call("track_package", email=customer_email)
 
-    result = get_tracking_by_email(customer_email)
+    result = await asyncio.to_thread(get_tracking_by_email, customer_email)
     if not result:
-        return json.dumps({
-            "found": False,
-            "customer_email": customer_email,
-            "message": "No customer found with this email. Please ask the customer to verify their email address.",
-        })
+        return customer_not_found(customer_email)
 
     if not result.get("tracking_number"):
         return json.dumps({
@@ -4,16 +4,64 @@ Phase 2: Uses Mock APIs (via APIFactory) to return realistic results.
 Phase 6: HITL forms for confirmation.
 
 Tools now return actual API responses instead of stubs.
-"""
 
-import json
+All four tools share one flow (_run_action): verify the customer,
+call the API, invalidate cached customer data on success, and shape
+the response. The public functions keep their own signatures and
+docstrings because Agno builds the tool schema from them.
+"""
 
-import structlog
+import asyncio
+from typing import Any, Awaitable, Callable
 
-from database.customer_queries import lookup_customer
+from database.customer_queries import invalidate_customer_cache, lookup_customer
 from mock_apis.factory import APIFactory
+from tools.common import customer_not_found, log_tool_call, normalize_email, to_json
+
+_NOT_FOUND = "Customer with this email not found."
+
+
+async def _run_action(
+    customer_email: str,
+    call_api: Callable[[], Awaitable[dict[str, Any]]],
+    shape: Callable[[dict[str, Any]], dict[str, Any]],
+    error_message: str,
+    not_found_message: str = _NOT_FOUND,
+) -> str:
+    """Verify the customer, call the API and build the tool response.
+
+    Args:
+        customer_email: Normalized customer email.
+        call_api: Coroutine factory performing the API call.
+        shape: Builds the action-specific response fields from the API result.
+        error_message: Fallback message when the API reports failure.
+        not_found_message: Message for unknown customers.
+
+    Returns:
+        JSON string with API result.
+    """
+    # 1. Verify customer exists (off the event loop)
+    customer = await asyncio.to_thread(lookup_customer, customer_email)
+    if not customer:
+        return customer_not_found(customer_email, not_found_message)
 
-logger = structlog.get_logger()
+    # 2. Call API (mock or real via Factory)
+    result = await call_api()
+
+    # 3. Return result
+    if not result["success"]:
+        return to_json({
+            "status": "error",
+            "message": result.get("error", error_message),
+        })
+
+    invalidate_customer_cache(customer_email)
+    return to_json({
+        "status": "completed",
+        "customer_email": customer_email,
+        "customer_name": customer.get("name"),
+        **shape(result),
+    })
 
 
 async def change_frequency(
@@ -32,37 +80,21 @@ async def change_frequency(
     Returns:
         JSON string with API result
     """
-    logger.info("tool_called", tool="change_frequency", email=customer_email, new_frequency=new_frequency)
+    customer_email = normalize_email(customer_email)
+    log_tool_call("change_frequency", email=customer_email, new_frequency=new_frequency)
 
-    # 1. Verify customer exists
-    customer = lookup_customer(customer_email)
-    if not customer:
-        return json.dumps({
-            "found": False,
-            "customer_email": customer_email,
-            "message": "Customer with this email not found. Please verify the email address.",
-        })
-
-    # 2. Call API (mock or real via Factory)
-    api = APIFactory.get_subscription_api()
-    result = await api.change_frequency(customer_email, new_frequency)
-
-    # 3. Return result
-    if result["success"]:
-        return json.dumps({
-            "status": "completed",
-            "customer_email": customer_email,
-            "customer_name": customer.get("name"),
+    return await _run_action(
+        customer_email,
+        lambda: APIFactory.get_subscription_api().change_frequency(customer_email, new_frequency),
+        lambda result: {
             "new_frequency": result["new_frequency"],
             "next_charge_date": result["next_charge_date"],
             "notification_sent": result["notification_sent"],
             "message": f"Frequency updated to {new_frequency}. Confirmation email sent.",
-        })
-    else:
-        return json.dumps({
-            "status": "error",
-            "message": result.get("error", "Failed to update frequency"),
-        })
+        },
+        "Failed to update frequency",
+        not_found_message=f"{_NOT_FOUND} Please verify the email address.",
+    )
 
 
 async def skip_month(
@@ -80,37 +112,20 @@ async def skip_month(
     Returns:
         JSON string with API result
     """
-    logger.info("tool_called", tool="skip_month", email=customer_email, month=month)
+    customer_email = normalize_email(customer_email)
+    log_tool_call("skip_month", email=customer_email, month=month)
 
-    # 1. Verify customer exists
-    customer = lookup_customer(customer_email)
-    if not customer:
-        return json.dumps({
-            "found": False,
-            "customer_email": customer_email,
-            "message": "Customer with this email not found.",
-        })
-
-    # 2. Call API
-    api = APIFactory.get_subscription_api()
-    result = await api.skip_month(customer_email, month)
-
-    # 3. Return result
-    if result["success"]:
-        return json.dumps({
-            "status": "completed",
-            "customer_email": customer_email,
-            "customer_name": customer.get("name"),
+    return await _run_action(
+        customer_email,
+        lambda: APIFactory.get_subscription_api().skip_month(customer_email, month),
+        lambda result: {
             "skipped_month": result["skipped_month"],
             "next_charge_date": result["next_charge_date"],
             "notification_sent": result["notification_sent"],
             "message": f"Skipped {result['skipped_month']}. Confirmation email sent.",
-        })
-    else:
-        return json.dumps({
-            "status": "error",
-            "message": result.get("error", "Failed to skip month"),
-        })
+        },
+        "Failed to skip month",
+    )
 
 
 async def pause_subscription(
@@ -129,36 +144,42 @@ async def pause_subscription(
     Returns:
         JSON string with API result
     """
-    logger.info("tool_called", tool="pause_subscription", email=customer_email, duration=duration_months)
-
-    # 1. Verify customer exists
-    customer = lookup_customer(customer_email)
-    if not customer:
-        return json.dumps({
-            "found": False,
-            "customer_email": customer_email,
-            "message": "Customer with this email not found.",
-        })
+    customer_email = normalize_email(customer_email)
+    log_tool_call("pause_subscription", email=customer_email, duration=duration_months)
 
-    # 2. Call API
-    api = APIFactory.get_subscription_api()
-    result = await api.pause_subscription(customer_email, duration_months)
-
-    # 3. Return result
-    if result["success"]:
-        return json.dumps({
-            "status": "completed",
-            "customer_email": customer_email,
-            "customer_name": customer.get("name"),
+    return await _run_action(
+        customer_email,
+        lambda: APIFactory.get_subscription_api().pause_subscription(customer_email, duration_months),
+        lambda result: {
             "paused_until": result["paused_until"],
             "notification_sent": result["notification_sent"],
             "message": f"Subscription paused until {result['paused_until']}. Confirmation email sent.",
-        })
-    else:
-        return json.dumps({
-            "status": "error",
-            "message": result.get("error", "Failed to pause subscription"),
-        })
+        },
+        "Failed to pause subscription",
+    )
+
+
+def _parse_address(new_address: str | dict) -> dict:
+    """Parse "Street, City, Country" into an address dict (dicts pass through)."""
+    if not isinstance(new_address, str):
+        return new_address
+    street, _, rest = new_address.partition(",")
+    city, _, country = rest.partition(",")
+    return {
+        "street": street.strip(),
+        "city": city.strip(),
+        "country": country.strip() or "Israel",
+    }
+
+
+def _shape_address(result: dict[str, Any]) -> dict[str, Any]:
+    validated = result["validated_address"]
+    return {
+        "new_address": f"{validated['street']}, {validated['city']}, {validated['country']}",
+        "validated": True,
+        "notification_sent": result["notification_sent"],
+        "message": "Address validated and updated. Confirmation email sent.",
+    }
 
 
 async def change_address(
@@ -177,47 +198,13 @@ async def change_address(
     Returns:
         JSON string with API result
     """
-    logger.info("tool_called", tool="change_address", email=customer_email)
-
-    # 1. Verify customer exists
-    customer = lookup_customer(customer_email)
-    if not customer:
-        return json.dumps({
-            "found": False,
-            "customer_email": customer_email,
-            "message": "Customer with this email not found.",
-        })
-
-    # 2. Parse address string to dict (simple parsing)
-    # Expected format: "Street, City, Country" or dict
-    if isinstance(new_address, str):
-        parts = [p.strip() for p in new_address.split(",")]
-        address_dict = {
-            "street": parts[0] if len(parts) > 0 else "",
-            "city": parts[1] if len(parts) > 1 else "",
-            "country": parts[2] if len(parts) > 2 else "Israel",
-        }
-    else:
-        address_dict = new_address
-
-    # 3. Call API
-    api = APIFactory.get_address_api()
-    result = await api.validate_and_update_address(customer_email, address_dict)
-
-    # 4. Return result
-    if result["success"]:
-        validated = result["validated_address"]
-        return json.dumps({
-            "status": "completed",
-            "customer_email": customer_email,
-            "customer_name": customer.get("name"),
-            "new_address": f"{validated['street']}, {validated['city']}, {validated['country']}",
-            "validated": True,
-            "notification_sent": result["notification_sent"],
-            "message": "Address validated and updated. Confirmation email sent.",
-        })
-    else:
-        return json.dumps({
-            "status": "error",
-            "message": result.get("error", "Failed to update address"),
-        })
+    customer_email = normalize_email(customer_email)
+    log_tool_call("change_address", email=customer_email)
+
+    address_dict = _parse_address(new_address)
+    return await _run_action(
+        customer_email,
+        lambda: APIFactory.get_address_api().validate_and_update_address(customer_email, address_dict),
+        _shape_address,
+        "Failed to update address",
+    )
@@ -1,5 +1,7 @@
 """Analytics agent with PostgresTools for natural language → SQL queries."""
 
+import asyncio
+
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
 from agno.tools.postgres import PostgresTools
@@ -75,3 +77,18 @@ analytics_agent = Agent(
     ],
     markdown=True,
 )
+
+
+async def warm_up() -> list[BaseException]:
+    """Open the agent's remote connections before the first /query.
+
+    PostgresTools connects and Pinecone sets up its client lazily, so
+    without this the first question pays those handshakes. Failures
+    are returned, not raised: warm-up is best effort.
+    """
+    results = await asyncio.gather(
+        asyncio.to_thread(postgres_tools.connect),
+        knowledge.asearch("warmup", max_results=1),
+        return_exceptions=True,
+    )
+    return [r for r in results if isinstance(r, BaseException)]
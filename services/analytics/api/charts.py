@@ -3,22 +3,62 @@
 Returns chart data as JSON that can be rendered in frontend or Jupyter notebooks.
 """
 
-import asyncio
-import json
+import hashlib
+from typing import Awaitable, Callable
 
-from fastapi import APIRouter, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import Response
 import plotly.graph_objects as go
-import plotly.utils
 
-from database.queries import get_category_breakdown, get_daily_trends
+from config import settings
+from database.cache import AsyncTTLCache
+from database.queries import get_category_breakdown, get_daily_trends, get_eval_decisions
 
 router = APIRouter()
 
+# Serialized figures are cached per (chart, days) and served with an
+# ETag so repeat dashboard loads can be answered with 304 Not Modified
+_chart_cache = AsyncTTLCache("charts", max_size=64, ttl_seconds=settings.metrics_cache_ttl_s)
+_CACHE_CONTROL = f"public, max-age={int(settings.metrics_cache_ttl_s)}"
+
+
+async def _chart_response(
+    request: Request,
+    key: tuple,
+    build_figure: Callable[[], Awaitable[go.Figure]],
+    nocache: bool = False,
+) -> Response:
+    """Serve a chart from the cache (or build it), honoring If-None-Match.
+
+    Args:
+        request: Incoming request (for the If-None-Match header).
+        key: Cache key, chart name plus query parameters.
+        build_figure: Coroutine factory that queries data and builds the figure.
+        nocache: Rebuild the figure even if a cached copy exists.
+
+    Returns:
+        JSON response with ETag/Cache-Control headers, or 304 if the
+        client's copy is current.
+    """
+    async def render() -> tuple[bytes, str]:
+        # Plotly's to_json uses orjson when installed; the figure was
+        # validated when built, so skip re-validating it here
+        fig = await build_figure()
+        body = fig.to_json(validate=False).encode()
+        return body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+    body, etag = await (render() if nocache else _chart_cache.get_or_load(key, render))
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 @router.get("/category-distribution")
 async def category_distribution_chart(
-    days: int = Query(7, ge=1, le=90, description="Number of days to look back")
+    request: Request,
+    days: int = Query(7, ge=1, le=90, description="Number of days to look back"),
+    nocache: bool = Query(False, description="Bypass the server-side chart cache"),
 ):
     """Return Plotly bar chart JSON for category distribution.
 
@@ -27,121 +67,124 @@ async def category_distribution_chart(
             .then(r => r.json())
             .then(fig => Plotly.newPlot('chart-div', fig.data, fig.layout))
     """
-    data = await asyncio.to_thread(get_category_breakdown, days)
-
-    if not data:
-        # Empty chart
-        fig = go.Figure()
-        fig.update_layout(
-            title=f"No data for last {days} days",
-            template="plotly_white",
-        )
-    else:
-        categories = [row["category"] for row in data]
-        counts = [row["count"] for row in data]
-
-        fig = go.Figure(
-            data=[go.Bar(x=categories, y=counts, marker_color="lightblue")]
-        )
-        fig.update_layout(
-            title=f"Messages by Category (Last {days} Days)",
-            xaxis_title="Category",
-            yaxis_title="Count",
-            template="plotly_white",
-        )
-
-    # Return JSON (Plotly-compatible format)
-    return JSONResponse(
-        content=json.loads(plotly.utils.PlotlyJSONEncoder().encode(fig))
-    )
+    async def build_figure() -> go.Figure:
+        data = await get_category_breakdown(days)
+
+        if not data:
+            # Empty chart
+            fig = go.Figure()
+            fig.update_layout(
+                title=f"No data for last {days} days",
+                template="plotly_white",
+            )
+        else:
+            categories = [row["category"] for row in data]
+            counts = [row["count"] for row in data]
+
+            fig = go.Figure(
+                data=[go.Bar(x=categories, y=counts, marker_color="lightblue")]
+            )
+            fig.update_layout(
+                title=f"Messages by Category (Last {days} Days)",
+                xaxis_title="Category",
+                yaxis_title="Count",
+                template="plotly_white",
+            )
+
+        return fig
+
+    return await _chart_response(request, ("category-distribution", days), build_figure, nocache)
 
 
 @router.get("/resolution-trend")
 async def resolution_trend_chart(
-    days: int = Query(30, ge=7, le=90, description="Number of days to look back")
+    request: Request,
+    days: int = Query(30, ge=7, le=90, description="Number of days to look back"),
+    nocache: bool = Query(False, description="Bypass the server-side chart cache"),
 ):
     """Line chart showing resolution rate over time.
 
     Helps identify trends and anomalies in AI performance.
     """
-    data = await asyncio.to_thread(get_daily_trends, days)
-
-    if not data:
-        fig = go.Figure()
-        fig.update_layout(
-            title=f"No data for last {days} days",
-            template="plotly_white",
-        )
-    else:
-        dates = [row["day"] for row in data]
-        resolution_rates = [row["resolution_rate_pct"] for row in data]
-
-        fig = go.Figure(
-            data=[
-                go.Scatter(
-                    x=dates,
-                    y=resolution_rates,
-                    mode="lines+markers",
-                    line=dict(color="green", width=2),
-                    marker=dict(size=6),
-                )
-            ]
-        )
-        fig.update_layout(
-            title="AI Resolution Rate Trend",
-            xaxis_title="Date",
-            yaxis_title="Resolution Rate (%)",
-            yaxis=dict(range=[0, 100]),
-            template="plotly_white",
-        )
-
-    return JSONResponse(
-        content=json.loads(plotly.utils.PlotlyJSONEncoder().encode(fig))
-    )
+    async def build_figure() -> go.Figure:
+        data = await get_daily_trends(days)
+
+        if not data:
+            fig = go.Figure()
+            fig.update_layout(
+                title=f"No data for last {days} days",
+                template="plotly_white",
+            )
+        else:
+            dates = [row["day"] for row in data]
+            resolution_rates = [row["resolution_rate_pct"] for row in data]
+
+            fig = go.Figure(
+                data=[
+                    go.Scatter(
+                        x=dates,
+                        y=resolution_rates,
+                        mode="lines+markers",
+                        line=dict(color="green", width=2),
+                        marker=dict(size=6),
+                    )
+                ]
+            )
+            fig.update_layout(
+                title="AI Resolution Rate Trend",
+                xaxis_title="Date",
+                yaxis_title="Resolution Rate (%)",
+                yaxis=dict(range=[0, 100]),
+                template="plotly_white",
+            )
+
+        return fig
+
+    return await _chart_response(request, ("resolution-trend", days), build_figure, nocache)
 
 
 @router.get("/eval-decision-breakdown")
 async def eval_decision_breakdown_chart(
-    days: int = Query(7, ge=1, le=90, description="Number of days to look back")
+    request: Request,
+    days: int = Query(7, ge=1, le=90, description="Number of days to look back"),
+    nocache: bool = Query(False, description="Bypass the server-side chart cache"),
 ):
     """Pie chart showing distribution of eval decisions (send/draft/escalate).
 
     Helps visualize how often AI auto-sends vs. requires review.
     """
-    data = await asyncio.to_thread(get_daily_trends, days)
-
-    if not data:
-        fig = go.Figure()
-        fig.update_layout(
-            title=f"No data for last {days} days",
-            template="plotly_white",
-        )
-    else:
-        # Aggregate totals across all days
-        total_sent = sum(row["auto_sent"] for row in data)
-        total_drafted = sum(row["drafted"] for row in data)
-        total_escalated = sum(row["escalated"] for row in data)
-
-        labels = ["Auto-sent", "Drafted", "Escalated"]
-        values = [total_sent, total_drafted, total_escalated]
-        colors = ["#90EE90", "#FFD700", "#FF6B6B"]
-
-        fig = go.Figure(
-            data=[
-                go.Pie(
-                    labels=labels,
-                    values=values,
-                    marker=dict(colors=colors),
-                    textinfo="label+percent",
-                    hovertemplate="<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>",
-                )
-            ]
-        )
-        fig.update_layout(
-            title=f"Eval Decision Distribution (Last {days} Days)",
-            template="plotly_white",
-        )
-
-    return JSONResponse(
-        content=json.loads(plotly.utils.PlotlyJSONEncoder().encode(fig))
-    )
+    async def build_figure() -> go.Figure:
+        # Totals are aggregated in Postgres (one row) rather than summed
+        # over per-day rows in Python
+        data = await get_eval_decisions(days)
+
+        if not data["total"]:
+            fig = go.Figure()
+            fig.update_layout(
+                title=f"No data for last {days} days",
+                template="plotly_white",
+            )
+        else:
+            labels = ["Auto-sent", "Drafted", "Escalated"]
+            values = [data["send"], data["draft"], data["escalate"]]
+            colors = ["#90EE90", "#FFD700", "#FF6B6B"]
+
+            fig = go.Figure(
+                data=[
+                    go.Pie(
+                        labels=labels,
+                        values=values,
+                        marker=dict(colors=colors),
+                        textinfo="label+percent",
+                        hovertemplate="<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>",
+                    )
+                ]
+            )
+            fig.update_layout(
+                title=f"Eval Decision Distribution (Last {days} Days)",
+                template="plotly_white",
+            )
+
+        return fig
+
+    return await _chart_response(request, ("eval-decision-breakdown", days), build_figure, nocache)
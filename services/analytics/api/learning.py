@@ -4,7 +4,6 @@ These endpoints help identify sessions that would be valuable for
 improving AI performance through learning and refinement.
 """
 
-import asyncio
 from typing import Any
 
 from fastapi import APIRouter, Query
@@ -48,6 +47,5 @@ async def get_candidates(
     - Enhancing tool usage patterns
     - Training data for future models
     """
-    # Run query in thread pool (sync psycopg)
-    data = await asyncio.to_thread(get_learning_candidates, days, limit)
+    data = await get_learning_candidates(days, limit)
     return [LearningCandidate(**row) for row in data]
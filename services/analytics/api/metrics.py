@@ -4,18 +4,19 @@ These endpoints provide fast responses without LLM overhead.
 For ad-hoc queries, use /query endpoint with natural language.
 """
 
-import asyncio
 from typing import Any
 
 from fastapi import APIRouter, Query
 from pydantic import BaseModel
 
+from database.cache import cache_stats, clear_all_caches
 from database.queries import (
     get_resolution_rate,
     get_category_breakdown,
     get_eval_decisions,
     get_customer_patterns,
     get_hitl_stats,
+    get_dashboard_summary,
 )
 
 router = APIRouter()
@@ -76,17 +77,15 @@ class HITLStats(BaseModel):
     by_tool: list[ToolHITLStats]
 
 
-@router.get("/overview", response_model=MetricsOverview)
-async def get_overview(
-    days: int = Query(7, ge=1, le=90, description="Number of days to look back")
-):
-    """Get high-level platform metrics for the last N days.
+class DashboardSummary(BaseModel):
+    """Overview, categories and HITL stats for the dashboard's initial load."""
+
+    overview: MetricsOverview
+    categories: list[CategoryMetrics]
+    hitl: HITLStats
 
-    Returns resolution rate, escalation rate, and average response time.
-    """
-    # Run query in thread pool (sync psycopg)
-    data = await asyncio.to_thread(get_resolution_rate, days)
 
+def _build_overview(days: int, data: dict[str, Any]) -> MetricsOverview:
     total = data["total_sessions"]
     if total == 0:
         return MetricsOverview(
@@ -114,6 +113,45 @@ async def get_overview(
     )
 
 
+def _build_hitl_stats(data: dict[str, Any]) -> HITLStats:
+    return HITLStats(
+        total_hitl_calls=data["total_hitl_calls"],
+        approved=data["approved"],
+        cancelled=data["cancelled"],
+        pending=data["pending"],
+        approval_rate_pct=data["approval_rate_pct"],
+        by_tool=[ToolHITLStats(**tool) for tool in data["by_tool"]],
+    )
+
+
+@router.get("/summary", response_model=DashboardSummary)
+async def get_summary(
+    days: int = Query(7, ge=1, le=90, description="Number of days to look back")
+):
+    """Get overview, category and HITL metrics in a single request.
+
+    Intended for the dashboard's initial load: the underlying queries run
+    in one database round trip.
+    """
+    data = await get_dashboard_summary(days)
+    return DashboardSummary(
+        overview=_build_overview(days, data["resolution_rate"]),
+        categories=[CategoryMetrics(**row) for row in data["categories"]],
+        hitl=_build_hitl_stats(data["hitl"]),
+    )
+
+
+@router.get("/overview", response_model=MetricsOverview)
+async def get_overview(
+    days: int = Query(7, ge=1, le=90, description="Number of days to look back")
+):
+    """Get high-level platform metrics for the last N days.
+
+    Returns resolution rate, escalation rate, and average response time.
+    """
+    return _build_overview(days, await get_resolution_rate(days))
+
+
 @router.get("/categories", response_model=list[CategoryMetrics])
 async def get_categories(
     days: int = Query(7, ge=1, le=90, description="Number of days to look back")
@@ -122,7 +160,7 @@ async def get_categories(
 
     Returns category distribution with resolution rates and response times.
     """
-    data = await asyncio.to_thread(get_category_breakdown, days)
+    data = await get_category_breakdown(days)
     return [CategoryMetrics(**row) for row in data]
 
 
@@ -135,7 +173,7 @@ async def get_patterns(
 
     Helps identify high-touch customers or systematic issues.
     """
-    data = await asyncio.to_thread(get_customer_patterns, days, min_sessions)
+    data = await get_customer_patterns(days, min_sessions)
     return [CustomerPattern(**row) for row in data]
 
 
@@ -154,13 +192,16 @@ async def get_hitl_statistics(
     Returns stats for tools that require explicit user confirmation
     before execution (pause subscription, change address, etc.).
     """
-    # Run query in thread pool (sync psycopg)
-    data = await asyncio.to_thread(get_hitl_stats, days)
-    return HITLStats(
-        total_hitl_calls=data["total_hitl_calls"],
-        approved=data["approved"],
-        cancelled=data["cancelled"],
-        pending=data["pending"],
-        approval_rate_pct=data["approval_rate_pct"],
-        by_tool=[ToolHITLStats(**tool) for tool in data["by_tool"]],
-    )
+    return _build_hitl_stats(await get_hitl_stats(days))
+
+
+@router.get("/cache")
+async def get_cache_stats() -> dict[str, dict[str, int]]:
+    """Entry counts and hit/miss counters for the metrics and chart caches."""
+    return cache_stats()
+
+
+@router.delete("/cache", status_code=204)
+async def clear_metrics_cache():
+    """Drop cached metrics and charts so the next request reads fresh data."""
+    clear_all_caches()
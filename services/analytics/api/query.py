@@ -2,15 +2,48 @@
 
 Allows users to ask analytics questions in plain language.
 The analytics agent converts questions to SQL and returns results.
+
+Clients that send ``Accept: text/event-stream`` get the answer streamed
+as Server-Sent Events (one ``{"delta": ...}`` per chunk, then a final
+``{"done": true, "sql_query": ...}``); everyone else gets the JSON
+QueryResponse once the agent finishes.
 """
 
-from fastapi import APIRouter
+import json
+import re
+from typing import AsyncIterator
+
+from agno.run.agent import RunContentEvent
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from agent import analytics_agent
 
 router = APIRouter()
 
+# First ```sql fenced block in an agent response
+_SQL_BLOCK_RE = re.compile(r"```sql\s*(.*?)```", re.DOTALL)
+
+
+def _extract_sql(answer: str) -> str | None:
+    """Return the first fenced SQL block in an agent answer, if any."""
+    # PostgresTools often includes the SQL in markdown code blocks
+    match = _SQL_BLOCK_RE.search(answer)
+    return match.group(1).strip() if match else None
+
+
+async def _stream_answer(question: str) -> AsyncIterator[str]:
+    """Yield SSE frames with answer deltas, then the extracted SQL."""
+    parts: list[str] = []
+    async for event in analytics_agent.arun(question, stream=True):
+        if isinstance(event, RunContentEvent) and event.content:
+            delta = str(event.content)
+            parts.append(delta)
+            yield f"data: {json.dumps({'delta': delta})}\n\n"
+    sql_query = _extract_sql("".join(parts))
+    yield f"data: {json.dumps({'done': True, 'sql_query': sql_query})}\n\n"
+
 
 class QueryRequest(BaseModel):
     """Natural language query request."""
@@ -27,7 +60,7 @@ class QueryResponse(BaseModel):
 
 
 @router.post("/query", response_model=QueryResponse)
-async def natural_language_query(req: QueryRequest):
+async def natural_language_query(req: QueryRequest, request: Request):
     """Natural language interface to analytics agent.
 
     The agent uses PostgresTools to:
@@ -48,23 +81,18 @@ async def natural_language_query(req: QueryRequest):
             - question: Original question
             - answer: Natural language answer with data
             - sql_query: Generated SQL (if extractable from response)
+        or an SSE stream when the client accepts text/event-stream.
     """
+    if "text/event-stream" in request.headers.get("accept", ""):
+        return StreamingResponse(
+            _stream_answer(req.question), media_type="text/event-stream",
+        )
+
     # Run agent (uses PostgresTools to generate and execute SQL)
     response = await analytics_agent.arun(req.question)
 
-    # Try to extract SQL query from response
-    # PostgresTools often includes the SQL in markdown code blocks
-    sql_query = None
-    if "```sql" in response.content:
-        try:
-            sql_start = response.content.find("```sql") + 6
-            sql_end = response.content.find("```", sql_start)
-            sql_query = response.content[sql_start:sql_end].strip()
-        except Exception:
-            pass  # Could not extract SQL, not critical
-
     return QueryResponse(
         question=req.question,
         answer=response.content,
-        sql_query=sql_query,
+        sql_query=_extract_sql(response.content),
     )
@@ -0,0 +1,132 @@
+"""Short-lived result cache for metrics queries and chart payloads.
+
+Dashboards poll the same endpoints with the same parameters, so query
+results are kept for a few seconds and shared between requests. A
+per-key asyncio.Lock makes concurrent misses wait for a single query
+instead of all hitting the database (single-flight).
+
+The cache is per process; each worker keeps its own copy. Every cache
+registers itself so clear_all_caches() can drop all results at once when
+the underlying data changes (e.g. after a rollup refresh).
+"""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+import structlog
+
+logger = structlog.get_logger()
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+_caches: dict[str, "AsyncTTLCache"] = {}
+
+
+class AsyncTTLCache:
+    """LRU cache with per-entry expiry and single-flight loading.
+
+    Only used from the event loop, so no thread locking is needed.
+    """
+
+    def __init__(self, name: str, max_size: int = 256, ttl_seconds: float = 60.0) -> None:
+        self.name = name
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+        _caches[name] = self
+
+    def _get(self, key: Hashable) -> tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _set(self, key: Hashable, value: Any) -> None:
+        if self.ttl_seconds <= 0 or self.max_size <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get_or_load(
+        self, key: Hashable, load: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached value for key, loading it once on a miss.
+
+        Args:
+            key: Cache key (endpoint name plus query parameters).
+            load: Coroutine factory that runs the underlying query.
+
+        Returns:
+            Cached or freshly loaded value.
+        """
+        hit, value = self._get(key)
+        if hit:
+            self.hits += 1
+            logger.debug("cache_hit", cache=self.name, key=key)
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                # Another request may have loaded it while we waited
+                hit, value = self._get(key)
+                if hit:
+                    self.hits += 1
+                    logger.debug("cache_hit", cache=self.name, key=key)
+                    return value
+                self.misses += 1
+                logger.debug("cache_miss", cache=self.name, key=key)
+                value = await load()
+                self._set(key, value)
+                return value
+        finally:
+            # Drop the lock once the load is done so parameterised keys do not
+            # accumulate; waiters already holding a reference still use it
+            if self._locks.get(key) is lock:
+                del self._locks[key]
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return entry count and hit/miss counters since startup."""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def cached(self, fn: F) -> F:
+        """Decorate an async query function so its results go through the cache.
+
+        The key is (function name, positional args, sorted keyword args).
+        Cached values are shared between callers and must not be mutated.
+        """
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+            return await self.get_or_load(key, lambda: fn(*args, **kwargs))
+
+        return wrapper  # type: ignore[return-value]
+
+
+def clear_all_caches() -> None:
+    """Drop the results of every registered cache."""
+    for cache in _caches.values():
+        cache.clear()
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    """Return stats() for every registered cache, keyed by cache name."""
+    return {name: cache.stats() for name, cache in _caches.items()}
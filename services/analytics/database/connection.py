@@ -1,30 +1,78 @@
 """PostgreSQL connection helper for direct database access.
 
-Uses psycopg3 for synchronous PostgreSQL queries.
+Uses psycopg3 async connections for the pre-defined metrics queries.
 This is separate from Agno's PostgresTools which handles natural language → SQL.
+
+Connections come from a process-wide psycopg_pool.AsyncConnectionPool,
+so metrics and chart endpoints reuse open connections instead of paying
+a connect/auth handshake per query, and await queries on the event loop
+instead of occupying worker threads.
 """
 
-import psycopg
-from contextlib import contextmanager
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from psycopg import AsyncConnection
+from psycopg_pool import AsyncConnectionPool
 
 from config import settings
 
+_pool: AsyncConnectionPool | None = None
+_pool_lock = asyncio.Lock()
+
+
+async def get_pool() -> AsyncConnectionPool:
+    """Return the shared connection pool, opening it on first use."""
+    global _pool
+    if _pool is None:
+        async with _pool_lock:
+            if _pool is None:
+                pool = AsyncConnectionPool(
+                    settings.analytics_db_url,
+                    min_size=settings.db_pool_min_size,
+                    max_size=settings.db_pool_max_size,
+                    kwargs={"autocommit": True},
+                    open=False,
+                )
+                await pool.open()
+                _pool = pool
+    return _pool
 
-@contextmanager
-def get_connection():
+
+async def close_pool() -> None:
+    """Close the shared connection pool (if it was opened)."""
+    global _pool
+    async with _pool_lock:
+        if _pool is not None:
+            await _pool.close()
+            _pool = None
+
+
+@asynccontextmanager
+async def get_connection(work_mem: str | None = None) -> AsyncIterator[AsyncConnection]:
     """Get PostgreSQL connection using read-only user.
 
     Usage:
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("SELECT * FROM chat_sessions LIMIT 10")
-                rows = cur.fetchall()
+        async with get_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute("SELECT * FROM chat_sessions LIMIT 10")
+                rows = await cur.fetchall()
+
+    Args:
+        work_mem: Optional work_mem (e.g. "64MB") for sort/hash-heavy
+            queries. Applied transaction-locally, so it is reset before the
+            connection goes back to the pool.
 
     Yields:
-        psycopg.Connection: Database connection
+        psycopg.AsyncConnection: Pooled database connection, returned to
+        the pool on exit.
     """
-    conn = psycopg.connect(settings.analytics_db_url)
-    try:
-        yield conn
-    finally:
-        conn.close()
+    pool = await get_pool()
+    async with pool.connection() as conn:
+        if work_mem is None:
+            yield conn
+            return
+        async with conn.transaction():
+            await conn.execute("SELECT set_config('work_mem', %s, true)", (work_mem,))
+            yield conn
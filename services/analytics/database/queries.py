@@ -2,15 +2,84 @@
 
 These functions provide fast, pre-computed metrics without LLM overhead.
 For ad-hoc queries, use the analytics agent with natural language.
+
+Queries are native async (psycopg AsyncConnection from the shared
+pool), so endpoints await them directly instead of hopping to a
+worker thread.
+
+Results are cached for settings.metrics_cache_ttl_s seconds (see
+metrics_cache), so dashboard refetches within that window do not reach
+the database. Every statement is executed with prepare=True: the pooled
+connections are long-lived, so each one parses and plans a query once
+and reuses the plan on later calls. Time windows are computed by
+Postgres (NOW() - make_interval(days => ...)), so the only parameter is
+the day count and app/DB clock skew does not matter.
 """
 
-from datetime import datetime, timedelta
 from typing import Any
 
+from psycopg.rows import dict_row
+
+from config import settings
+from database.cache import AsyncTTLCache
 from database.connection import get_connection
 
 
-def get_resolution_rate(days: int = 7) -> dict[str, Any]:
+def _isoformat_column(rows: list[dict[str, Any]], column: str) -> list[dict[str, Any]]:
+    """Render a timestamp column with datetime.isoformat(), the API's format."""
+    for row in rows:
+        if row[column] is not None:
+            row[column] = row[column].isoformat()
+    return rows
+
+
+# Rollup windows match the live NOW() - N days filter exactly: whole days
+# after the window's first day come from the per-day rollup, and the first
+# (partial) day is aggregated from the base table.
+_WINDOW_START = "NOW() - make_interval(days => %(days)s::int)"
+_ROLLUP_DAYS = f"day > DATE_TRUNC('day', {_WINDOW_START})"
+_FIRST_DAY = (
+    f"created_at >= {_WINDOW_START} "
+    f"AND created_at < DATE_TRUNC('day', {_WINDOW_START}) + interval '1 day'"
+)
+
+# Dashboards refetch the same metrics many times a minute; share results per TTL window
+metrics_cache = AsyncTTLCache("metrics", max_size=256, ttl_seconds=settings.metrics_cache_ttl_s)
+
+
+_RESOLUTION_RATE_SQL = """
+    SELECT
+        COUNT(*) as total_sessions,
+        COUNT(*) FILTER (WHERE eval_decision = 'send') as auto_sent,
+        COUNT(*) FILTER (WHERE eval_decision = 'draft') as drafted,
+        COUNT(*) FILTER (WHERE eval_decision = 'escalate') as escalated,
+        AVG(first_response_time_ms) as avg_response_time_ms
+    FROM chat_sessions
+    WHERE created_at >= NOW() - make_interval(days => %s::int)
+"""
+
+
+def _resolution_rate_from_row(row: tuple | None) -> dict[str, Any]:
+    if not row:
+        return {
+            "total_sessions": 0,
+            "auto_sent": 0,
+            "drafted": 0,
+            "escalated": 0,
+            "avg_response_time_ms": 0,
+        }
+
+    return {
+        "total_sessions": row[0] or 0,
+        "auto_sent": row[1] or 0,
+        "drafted": row[2] or 0,
+        "escalated": row[3] or 0,
+        "avg_response_time_ms": round(row[4], 2) if row[4] else 0,
+    }
+
+
+@metrics_cache.cached
+async def get_resolution_rate(days: int = 7) -> dict[str, Any]:
     """Calculate AI resolution rate for last N days.
 
     Args:
@@ -24,43 +93,13 @@ def get_resolution_rate(days: int = 7) -> dict[str, Any]:
             - escalated: Number of sessions escalated
             - avg_response_time_ms: Average response time in milliseconds
     """
-    since = datetime.now() - timedelta(days=days)
-
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT
-                    COUNT(*) as total_sessions,
-                    COUNT(*) FILTER (WHERE eval_decision = 'send') as auto_sent,
-                    COUNT(*) FILTER (WHERE eval_decision = 'draft') as drafted,
-                    COUNT(*) FILTER (WHERE eval_decision = 'escalate') as escalated,
-                    AVG(first_response_time_ms) as avg_response_time_ms
-                FROM chat_sessions
-                WHERE created_at >= %s
-            """,
-                (since,),
-            )
-            row = cur.fetchone()
-            if not row:
-                return {
-                    "total_sessions": 0,
-                    "auto_sent": 0,
-                    "drafted": 0,
-                    "escalated": 0,
-                    "avg_response_time_ms": 0,
-                }
-
-            return {
-                "total_sessions": row[0] or 0,
-                "auto_sent": row[1] or 0,
-                "drafted": row[2] or 0,
-                "escalated": row[3] or 0,
-                "avg_response_time_ms": round(row[4], 2) if row[4] else 0,
-            }
+    async with get_connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(_RESOLUTION_RATE_SQL, (days,), prepare=True)
+            return _resolution_rate_from_row(await cur.fetchone())
 
 
-def get_eval_decisions(days: int = 7) -> dict[str, int]:
+async def get_eval_decisions(days: int = 7) -> dict[str, int]:
     """Get count of each eval decision.
 
     Args:
@@ -69,7 +108,7 @@ def get_eval_decisions(days: int = 7) -> dict[str, int]:
     Returns:
         dict with keys: total, send, draft, escalate
     """
-    data = get_resolution_rate(days)
+    data = await get_resolution_rate(days)
     return {
         "total": data["total_sessions"],
         "send": data["auto_sent"],
@@ -78,7 +117,50 @@ def get_eval_decisions(days: int = 7) -> dict[str, int]:
     }
 
 
-def get_category_breakdown(days: int = 7) -> list[dict[str, Any]]:
+_CATEGORY_BREAKDOWN_SQL = f"""
+    WITH daily AS (
+        SELECT primary_category, sessions, auto_sent, response_time_sum_ms, response_time_count
+        FROM mv_category_daily
+        WHERE {_ROLLUP_DAYS}
+        UNION ALL
+        SELECT
+            primary_category,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE eval_decision = 'send'),
+            SUM(first_response_time_ms),
+            COUNT(first_response_time_ms)
+        FROM chat_sessions
+        WHERE {_FIRST_DAY}
+        GROUP BY primary_category
+    )
+    SELECT
+        primary_category,
+        SUM(sessions)::bigint,
+        SUM(auto_sent)::bigint,
+        SUM(response_time_sum_ms)::bigint,
+        SUM(response_time_count)::bigint
+    FROM daily
+    GROUP BY primary_category
+    ORDER BY 2 DESC
+"""
+
+
+def _category_breakdown_from_rows(rows: list[tuple]) -> list[dict[str, Any]]:
+    total = sum(row[1] for row in rows)
+    return [
+        {
+            "category": category,
+            "count": count,
+            "percentage": round(100.0 * count / total, 2) if total else 0,
+            "resolution_rate": round(100.0 * sent / count, 2) if count else 0,
+            "avg_response_time_ms": round(rt_sum / rt_count) if rt_count else 0,
+        }
+        for category, count, sent, rt_sum, rt_count in rows
+    ]
+
+
+@metrics_cache.cached
+async def get_category_breakdown(days: int = 7) -> list[dict[str, Any]]:
     """Get message count and metrics by category.
 
     Args:
@@ -92,38 +174,16 @@ def get_category_breakdown(days: int = 7) -> list[dict[str, Any]]:
             - resolution_rate: % of sessions auto-sent in this category
             - avg_response_time_ms: Average response time for this category
     """
-    since = datetime.now() - timedelta(days=days)
+    # Sum the per-day category rollup over the window; totals and ratios are
+    # computed here instead of with a window function over chat_sessions.
+    async with get_connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(_CATEGORY_BREAKDOWN_SQL, {"days": days}, prepare=True)
+            return _category_breakdown_from_rows(await cur.fetchall())
 
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT
-                    primary_category as category,
-                    COUNT(*) as count,
-                    ROUND(100.0 * COUNT(*) / SUM(COUNT(*)) OVER (), 2) as percentage,
-                    ROUND(100.0 * COUNT(*) FILTER (WHERE eval_decision = 'send') / COUNT(*), 2) as resolution_rate,
-                    ROUND(AVG(first_response_time_ms), 0) as avg_response_time_ms
-                FROM chat_sessions
-                WHERE created_at >= %s
-                GROUP BY primary_category
-                ORDER BY count DESC
-            """,
-                (since,),
-            )
-            return [
-                {
-                    "category": row[0],
-                    "count": row[1],
-                    "percentage": float(row[2]) if row[2] else 0,
-                    "resolution_rate": float(row[3]) if row[3] else 0,
-                    "avg_response_time_ms": int(row[4]) if row[4] else 0,
-                }
-                for row in cur.fetchall()
-            ]
-
-
-def get_daily_trends(days: int = 30) -> list[dict[str, Any]]:
+
+@metrics_cache.cached
+async def get_daily_trends(days: int = 30) -> list[dict[str, Any]]:
     """Get daily resolution rate trend.
 
     Args:
@@ -138,40 +198,45 @@ def get_daily_trends(days: int = 30) -> list[dict[str, Any]]:
             - escalated: Sessions escalated
             - resolution_rate_pct: Resolution rate percentage
     """
-    since = datetime.now() - timedelta(days=days)
-
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
+    # Reads the pre-aggregated daily rollup (see refresh_rollups) instead
+    # of re-scanning chat_sessions; today's row lags by up to one refresh.
+    # Formatting and rounding happen in SQL, so rows are returned as-is.
+    async with get_connection() as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(
+                f"""
                 SELECT
-                    DATE_TRUNC('day', created_at) as day,
-                    COUNT(*) as total,
-                    COUNT(*) FILTER (WHERE eval_decision = 'send') as auto_sent,
-                    COUNT(*) FILTER (WHERE eval_decision = 'draft') as drafted,
-                    COUNT(*) FILTER (WHERE eval_decision = 'escalate') as escalated,
-                    ROUND(100.0 * COUNT(*) FILTER (WHERE eval_decision = 'send') / COUNT(*), 2) as resolution_rate_pct
-                FROM chat_sessions
-                WHERE created_at >= %s
-                GROUP BY day
-                ORDER BY day DESC
+                    to_char(m.day, 'YYYY-MM-DD') as day,
+                    m.total,
+                    m.auto_sent,
+                    m.drafted,
+                    m.escalated,
+                    ROUND(100.0 * m.auto_sent / m.total, 2)::float as resolution_rate_pct
+                FROM (
+                    SELECT day, total, auto_sent, drafted, escalated
+                    FROM mv_daily_session_stats
+                    WHERE {_ROLLUP_DAYS}
+                    UNION ALL
+                    SELECT
+                        DATE_TRUNC('day', created_at),
+                        COUNT(*),
+                        COUNT(*) FILTER (WHERE eval_decision = 'send'),
+                        COUNT(*) FILTER (WHERE eval_decision = 'draft'),
+                        COUNT(*) FILTER (WHERE eval_decision = 'escalate')
+                    FROM chat_sessions
+                    WHERE {_FIRST_DAY}
+                    GROUP BY 1
+                ) m
+                ORDER BY m.day DESC
             """,
-                (since,),
+                {"days": days},
+                prepare=True,
             )
-            return [
-                {
-                    "day": row[0].strftime("%Y-%m-%d"),
-                    "total": row[1],
-                    "auto_sent": row[2],
-                    "drafted": row[3],
-                    "escalated": row[4],
-                    "resolution_rate_pct": float(row[5]) if row[5] else 0,
-                }
-                for row in cur.fetchall()
-            ]
-
-
-def get_customer_patterns(days: int = 30, min_sessions: int = 2) -> list[dict[str, Any]]:
+            return await cur.fetchall()
+
+
+@metrics_cache.cached
+async def get_customer_patterns(days: int = 30, min_sessions: int = 2) -> list[dict[str, Any]]:
     """Get customers with repeat sessions.
 
     Args:
@@ -186,43 +251,70 @@ def get_customer_patterns(days: int = 30, min_sessions: int = 2) -> list[dict[st
             - last_interaction: Last interaction timestamp
             - escalation_rate: % of sessions escalated for this customer
     """
-    since = datetime.now() - timedelta(days=days)
-
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
+    # Counts come from the per-day customer rollup; only the top customers
+    # go back to chat_sessions (via the (customer_email, created_at) index)
+    # for their most common category.
+    async with get_connection(work_mem=settings.db_query_work_mem) as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(
+                f"""
+                WITH daily AS (
+                    SELECT customer_email, sessions, escalated, last_interaction
+                    FROM mv_customer_daily
+                    WHERE {_ROLLUP_DAYS}
+                    UNION ALL
+                    SELECT
+                        customer_email,
+                        COUNT(*),
+                        COUNT(*) FILTER (WHERE eval_decision = 'escalate'),
+                        MAX(created_at)
+                    FROM chat_sessions
+                    WHERE {_FIRST_DAY} AND customer_email IS NOT NULL
+                    GROUP BY customer_email
+                ),
+                top_customers AS (
+                    SELECT
+                        customer_email,
+                        SUM(sessions)::bigint as session_count,
+                        SUM(escalated)::bigint as escalated,
+                        MAX(last_interaction) as last_interaction
+                    FROM daily
+                    GROUP BY customer_email
+                    HAVING SUM(sessions) >= %(min_sessions)s
+                    ORDER BY session_count DESC
+                    LIMIT 50
+                )
                 SELECT
-                    customer_email,
-                    COUNT(DISTINCT session_id) as session_count,
-                    MODE() WITHIN GROUP (ORDER BY primary_category) as most_common_category,
-                    MAX(created_at) as last_interaction,
-                    ROUND(100.0 * COUNT(*) FILTER (WHERE eval_decision = 'escalate') / COUNT(*), 2) as escalation_rate
-                FROM chat_sessions
-                WHERE created_at >= %s
-                GROUP BY customer_email
-                HAVING COUNT(DISTINCT session_id) >= %s
-                ORDER BY session_count DESC
-                LIMIT 50
+                    t.customer_email,
+                    t.session_count,
+                    (
+                        SELECT s.primary_category
+                        FROM chat_sessions s
+                        WHERE s.customer_email = t.customer_email
+                            AND s.created_at >= NOW() - make_interval(days => %(days)s::int)
+                            AND s.primary_category IS NOT NULL
+                        GROUP BY s.primary_category
+                        ORDER BY COUNT(*) DESC, s.primary_category
+                        LIMIT 1
+                    ) as most_common_category,
+                    t.last_interaction,
+                    ROUND(100.0 * t.escalated / t.session_count, 2)::float as escalation_rate
+                FROM top_customers t
+                ORDER BY t.session_count DESC
             """,
-                (since, min_sessions),
+                {"days": days, "min_sessions": min_sessions},
+                prepare=True,
             )
-            return [
-                {
-                    "customer_email": row[0],
-                    "session_count": row[1],
-                    "most_common_category": row[2],
-                    "last_interaction": row[3].isoformat() if row[3] else None,
-                    "escalation_rate": float(row[4]) if row[4] else 0,
-                }
-                for row in cur.fetchall()
-            ]
-
-
-def get_learning_candidates(days: int = 7, limit: int = 50) -> list[dict[str, Any]]:
+            return _isoformat_column(await cur.fetchall(), "last_interaction")
+
+
+@metrics_cache.cached
+async def get_learning_candidates(days: int = 7, limit: int = 50) -> list[dict[str, Any]]:
     """Get sessions that are good candidates for learning/training.
 
     Identifies cases where AI had low confidence or made multiple attempts.
+    Tool counts come from mv_session_tools, so they lag by up to one rollup
+    refresh.
 
     Args:
         days: Number of days to look back
@@ -240,20 +332,10 @@ def get_learning_candidates(days: int = 7, limit: int = 50) -> list[dict[str, An
             - created_at: Timestamp
             - reason: Why this is a learning candidate
     """
-    since = datetime.now() - timedelta(days=days)
-
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
+    async with get_connection(work_mem=settings.db_query_work_mem) as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(
                 """
-                WITH session_tools AS (
-                    SELECT
-                        session_id,
-                        COUNT(*) as tool_count,
-                        COUNT(DISTINCT tool_name) as unique_tools
-                    FROM tool_executions
-                    GROUP BY session_id
-                )
                 SELECT
                     s.session_id,
                     s.customer_email,
@@ -271,8 +353,8 @@ def get_learning_candidates(days: int = 7, limit: int = 50) -> list[dict[str, An
                         ELSE 'Edge case'
                     END as reason
                 FROM chat_sessions s
-                LEFT JOIN session_tools st ON s.session_id = st.session_id
-                WHERE s.created_at >= %s
+                LEFT JOIN mv_session_tools st ON s.session_id = st.session_id
+                WHERE s.created_at >= NOW() - make_interval(days => %s::int)
                     AND (
                         s.eval_decision IN ('draft', 'escalate')
                         OR s.eval_confidence = 'low'
@@ -282,25 +364,64 @@ def get_learning_candidates(days: int = 7, limit: int = 50) -> list[dict[str, An
                 ORDER BY s.created_at DESC
                 LIMIT %s
             """,
-                (since, limit),
+                (days, limit),
+                prepare=True,
             )
-            return [
-                {
-                    "session_id": row[0],
-                    "customer_email": row[1],
-                    "primary_category": row[2],
-                    "eval_decision": row[3],
-                    "eval_confidence": row[4],
-                    "total_messages": row[5],
-                    "tools_used_count": row[6],
-                    "created_at": row[7].isoformat() if row[7] else None,
-                    "reason": row[8],
-                }
-                for row in cur.fetchall()
-            ]
-
-
-def get_hitl_stats(days: int = 7) -> dict[str, Any]:
+            return _isoformat_column(await cur.fetchall(), "created_at")
+
+
+_HITL_SQL = f"""
+    WITH daily AS (
+        SELECT tool_name, total, approved, cancelled, pending
+        FROM mv_hitl_daily
+        WHERE {_ROLLUP_DAYS}
+        UNION ALL
+        SELECT
+            tool_name,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE approval_status = 'approved'),
+            COUNT(*) FILTER (WHERE approval_status = 'cancelled'),
+            COUNT(*) FILTER (WHERE approval_status IS NULL)
+        FROM tool_executions
+        WHERE requires_approval = true AND {_FIRST_DAY}
+        GROUP BY tool_name
+    )
+    SELECT
+        tool_name,
+        SUM(total)::bigint,
+        SUM(approved)::bigint,
+        SUM(cancelled)::bigint,
+        SUM(pending)::bigint
+    FROM daily
+    GROUP BY tool_name
+    ORDER BY 2 DESC
+"""
+
+
+def _hitl_stats_from_rows(rows: list[tuple]) -> dict[str, Any]:
+    total = sum(row[1] for row in rows)
+    approved = sum(row[2] for row in rows)
+    return {
+        "total_hitl_calls": total,
+        "approved": approved,
+        "cancelled": sum(row[3] for row in rows),
+        "pending": sum(row[4] for row in rows),
+        "approval_rate_pct": round(100 * approved / total, 2) if total > 0 else 0,
+        "by_tool": [
+            {
+                "tool_name": tool_name,
+                "total_calls": calls,
+                "approved": tool_approved,
+                "cancelled": tool_cancelled,
+                "approval_rate_pct": round(100 * tool_approved / calls, 2) if calls else 0,
+            }
+            for tool_name, calls, tool_approved, tool_cancelled, _ in rows
+        ],
+    }
+
+
+@metrics_cache.cached
+async def get_hitl_stats(days: int = 7) -> dict[str, Any]:
     """Get HITL (Human-in-the-Loop) confirmation statistics.
 
     Args:
@@ -315,63 +436,50 @@ def get_hitl_stats(days: int = 7) -> dict[str, Any]:
             - approval_rate_pct: Approval rate percentage
             - by_tool: Breakdown by tool name with approval rates
     """
-    since = datetime.now() - timedelta(days=days)
+    async with get_connection() as conn:
+        async with conn.cursor() as cur:
+            # One pass over the per-day rollup; overall totals are the per-tool sums
+            await cur.execute(_HITL_SQL, {"days": days}, prepare=True)
+            return _hitl_stats_from_rows(await cur.fetchall())
 
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            # Overall stats
-            cur.execute(
-                """
-                SELECT
-                    COUNT(*) as total,
-                    COUNT(*) FILTER (WHERE approval_status = 'approved') as approved,
-                    COUNT(*) FILTER (WHERE approval_status = 'cancelled') as cancelled,
-                    COUNT(*) FILTER (WHERE approval_status IS NULL) as pending
-                FROM tool_executions
-                WHERE created_at >= %s
-                    AND requires_approval = true
-            """,
-                (since,),
-            )
-            overall = cur.fetchone()
-            total = overall[0] or 0
-            approved = overall[1] or 0
-            cancelled = overall[2] or 0
-            pending = overall[3] or 0
-
-            # By tool breakdown
-            cur.execute(
-                """
-                SELECT
-                    tool_name,
-                    COUNT(*) as total_calls,
-                    COUNT(*) FILTER (WHERE approval_status = 'approved') as approved,
-                    COUNT(*) FILTER (WHERE approval_status = 'cancelled') as cancelled,
-                    ROUND(100.0 * COUNT(*) FILTER (WHERE approval_status = 'approved') / NULLIF(COUNT(*), 0), 2) as approval_rate
-                FROM tool_executions
-                WHERE created_at >= %s
-                    AND requires_approval = true
-                GROUP BY tool_name
-                ORDER BY total_calls DESC
-            """,
-                (since,),
-            )
-            by_tool = [
-                {
-                    "tool_name": row[0],
-                    "total_calls": row[1],
-                    "approved": row[2],
-                    "cancelled": row[3],
-                    "approval_rate_pct": float(row[4]) if row[4] else 0,
-                }
-                for row in cur.fetchall()
-            ]
-
-            return {
-                "total_hitl_calls": total,
-                "approved": approved,
-                "cancelled": cancelled,
-                "pending": pending,
-                "approval_rate_pct": round(100 * approved / total, 2) if total > 0 else 0,
-                "by_tool": by_tool,
-            }
+
+@metrics_cache.cached
+async def get_dashboard_summary(days: int = 7) -> dict[str, Any]:
+    """Get resolution rate, category breakdown and HITL stats in one round trip.
+
+    The three SELECTs are sent in psycopg pipeline mode, so the dashboard's
+    initial load costs one network round trip instead of three.
+
+    Args:
+        days: Number of days to look back
+
+    Returns:
+        dict with keys:
+            - resolution_rate: Same shape as get_resolution_rate
+            - categories: Same shape as get_category_breakdown
+            - hitl: Same shape as get_hitl_stats
+    """
+    async with get_connection() as conn:
+        async with conn.pipeline():
+            rate_cur = conn.cursor()
+            category_cur = conn.cursor()
+            hitl_cur = conn.cursor()
+            await rate_cur.execute(_RESOLUTION_RATE_SQL, (days,), prepare=True)
+            await category_cur.execute(_CATEGORY_BREAKDOWN_SQL, {"days": days}, prepare=True)
+            await hitl_cur.execute(_HITL_SQL, {"days": days}, prepare=True)
+        # Leaving the pipeline block syncs, so every result is available now
+        return {
+            "resolution_rate": _resolution_rate_from_row(await rate_cur.fetchone()),
+            "categories": _category_breakdown_from_rows(await category_cur.fetchall()),
+            "hitl": _hitl_stats_from_rows(await hitl_cur.fetchall()),
+        }
+
+
+async def refresh_rollups() -> None:
+    """Refresh the materialized analytics rollups.
+
+    Calls the SECURITY DEFINER function refresh_analytics_rollups(), which
+    runs REFRESH MATERIALIZED VIEW CONCURRENTLY so readers are not blocked.
+    """
+    async with get_connection() as conn:
+        await conn.execute("SELECT refresh_analytics_rollups()")
@@ -5,11 +5,17 @@ into the analytics agent's knowledge base for RAG-powered SQL generation.
 
 Run once after database setup:
     python load_knowledge.py
+
+Files are collected first and then inserted concurrently (bounded by
+INSERT_CONCURRENCY), so embedding requests and Pinecone upserts overlap
+instead of running one file at a time.
 """
 
+import asyncio
 import json
 import os
 from pathlib import Path
+from typing import Any
 
 from agno.knowledge.knowledge import Knowledge
 from agno.vectordb.pineconedb import PineconeDb
@@ -36,82 +42,95 @@ vector_db = PineconeDb(
 )
 knowledge = Knowledge(vector_db=vector_db)
 
-def load_schemas():
-    """Load table schema descriptions from JSON files."""
+# Max concurrent add_content calls (each embeds and upserts one document)
+INSERT_CONCURRENCY = 8
+
+
+def load_schemas() -> list[dict[str, Any]]:
+    """Collect table schema descriptions from JSON files."""
     schemas_dir = Path("knowledge/schemas")
     if not schemas_dir.exists():
         print(f"❌ Schemas directory not found: {schemas_dir}")
-        return 0
+        return []
 
-    count = 0
+    contents = []
     for schema_file in schemas_dir.glob("*.json"):
-        with open(schema_file) as f:
-            schema = json.load(f)
+        # Embed the file as written; it is only parsed for the table name
+        text = schema_file.read_text()
+        table = json.loads(text)["table"]
 
-        knowledge.add_content(
-            text_content=json.dumps(schema, indent=2),
-            metadata={
+        contents.append({
+            "text_content": text,
+            "metadata": {
                 "type": "table_schema",
-                "table": schema["table"],
+                "table": table,
                 "source": schema_file.name,
             },
-        )
-        print(f"✅ Loaded schema: {schema['table']}")
-        count += 1
+            "label": f"schema: {table}",
+        })
 
-    return count
+    return contents
 
 
-def load_sample_queries():
-    """Load sample SQL queries from .sql files."""
+def load_sample_queries() -> list[dict[str, Any]]:
+    """Collect sample SQL queries from .sql files."""
     queries_dir = Path("knowledge/queries")
     if not queries_dir.exists():
         print(f"❌ Queries directory not found: {queries_dir}")
-        return 0
+        return []
 
-    count = 0
+    contents = []
     for query_file in queries_dir.glob("*.sql"):
-        with open(query_file) as f:
-            query = f.read()
+        query = query_file.read_text()
 
         query_name = query_file.stem  # filename without extension
-        knowledge.add_content(
-            text_content=query,
-            metadata={
+        contents.append({
+            "text_content": query,
+            "metadata": {
                 "type": "sample_query",
                 "name": query_name,
                 "source": query_file.name,
             },
-        )
-        print(f"✅ Loaded query: {query_name}")
-        count += 1
+            "label": f"query: {query_name}",
+        })
 
-    return count
+    return contents
 
 
-def load_business_rules():
-    """Load business rules and metrics definitions from JSON files."""
+def load_business_rules() -> list[dict[str, Any]]:
+    """Collect business rules and metrics definitions from JSON files."""
     rules_dir = Path("knowledge/rules")
     if not rules_dir.exists():
         print(f"❌ Rules directory not found: {rules_dir}")
-        return 0
+        return []
 
-    count = 0
+    contents = []
     for rules_file in rules_dir.glob("*.json"):
-        with open(rules_file) as f:
-            rules = json.load(f)
-
-        knowledge.add_content(
-            text_content=json.dumps(rules, indent=2),
-            metadata={
+        contents.append({
+            "text_content": rules_file.read_text(),
+            "metadata": {
                 "type": "business_rules",
                 "source": rules_file.name,
             },
-        )
-        print(f"✅ Loaded rules: {rules_file.stem}")
-        count += 1
+            "label": f"rules: {rules_file.stem}",
+        })
+
+    return contents
+
+
+async def insert_contents(contents: list[dict[str, Any]]) -> None:
+    """Embed and upsert all collected contents concurrently."""
+    semaphore = asyncio.Semaphore(INSERT_CONCURRENCY)
+
+    async def insert(content: dict[str, Any]) -> None:
+        async with semaphore:
+            await knowledge.add_content_async(
+                text_content=content["text_content"],
+                metadata=content["metadata"],
+            )
+        print(f"✅ Loaded {content['label']}")
 
-    return count
+    await asyncio.gather(*(insert(content) for content in contents))
 
 
 if __name__ == "__main__":
@@ -119,10 +138,12 @@ if __name__ == "__main__":
     print(f"📊 Database: {settings.analytics_db_url.split('@')[1]}\n")  # Hide password
 
     try:
-        schemas_count = load_schemas()
-        queries_count = load_sample_queries()
-        rules_count = load_business_rules()
+        schemas = load_schemas()
+        queries = load_sample_queries()
+        rules = load_business_rules()
+        asyncio.run(insert_contents(schemas + queries + rules))
 
+        schemas_count, queries_count, rules_count = len(schemas), len(queries), len(rules)
         total = schemas_count + queries_count + rules_count
         print(f"\n✨ Knowledge base loaded successfully!")
         print(f"   - {schemas_count} table schemas")
@@ -4,30 +4,81 @@ Combines AgentOS (analytics agent + Control Plane) with custom FastAPI routes
 for pre-computed metrics and Plotly visualizations.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+
+import orjson
 import structlog
 from fastapi import FastAPI
 from agno.os import AgentOS
 
 from config import settings
-from agent import analytics_agent
+from agent import analytics_agent, warm_up
+from database.cache import clear_all_caches
+from database.connection import close_pool, get_pool
+from database.queries import refresh_rollups
 
 # Configure structured logging
 structlog.configure(
     processors=[
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.add_log_level,
-        structlog.processors.JSONRenderer(),
+        # orjson renders straight to bytes; BytesLogger writes them without a str round trip
+        structlog.processors.JSONRenderer(serializer=orjson.dumps),
     ],
-    logger_factory=structlog.PrintLoggerFactory(),
+    logger_factory=structlog.BytesLoggerFactory(),
 )
 
 logger = structlog.get_logger()
 
+
+async def _warm_up() -> None:
+    """Open DB pool, PostgresTools and Pinecone connections in the background."""
+    errors = await warm_up()
+    try:
+        await get_pool()
+    except Exception as e:
+        errors.append(e)
+    if errors:
+        logger.warning("warmup_incomplete", errors=[str(e) for e in errors])
+    else:
+        logger.info("warmup_complete")
+
+
+async def _refresh_rollups_periodically(interval_s: float) -> None:
+    """Refresh materialized rollups every interval_s seconds."""
+    while True:
+        await asyncio.sleep(interval_s)
+        try:
+            await refresh_rollups()
+            # Cached metrics and charts were computed from the old rollups
+            clear_all_caches()
+            logger.debug("rollups_refreshed")
+        except Exception as e:
+            logger.warning("rollup_refresh_failed", error=str(e))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup and shutdown events."""
+    # Warm up without delaying startup (the health check stays responsive)
+    tasks = [asyncio.create_task(_warm_up())]
+    if settings.rollup_refresh_interval_s > 0:
+        tasks.append(asyncio.create_task(
+            _refresh_rollups_periodically(settings.rollup_refresh_interval_s)
+        ))
+    yield
+    for task in tasks:
+        task.cancel()
+    await close_pool()
+
+
 # Create custom FastAPI app
 app = FastAPI(
     title="Lev Haolam Analytics",
     version="1.0.0",
     description="Analytics service for AI support platform monitoring",
+    lifespan=lifespan,
 )
 
 
@@ -35,13 +35,10 @@ bot_payload = {
     "outgoing_url": "http://ai-engine:8000/api/webhook/chatwoot",
 }
 
-print(f"Creating Agent Bot on {CHATWOOT_URL}...")
-resp = httpx.post(
-    f"{CHATWOOT_URL}/api/v1/accounts/{ACCOUNT_ID}/agent_bots",
-    json=bot_payload,
-    headers=headers,
-    timeout=10.0,
-)
+# One client for all setup calls, so further requests reuse the connection
+with httpx.Client(base_url=CHATWOOT_URL, headers=headers, timeout=10.0) as client:
+    print(f"Creating Agent Bot on {CHATWOOT_URL}...")
+    resp = client.post(f"/api/v1/accounts/{ACCOUNT_ID}/agent_bots", json=bot_payload)
 
 if resp.status_code in (200, 201):
     data = resp.json()
@@ -1,5 +1,7 @@
 """Configuration for Dash Analytics Agent."""
 
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -18,6 +20,17 @@ class Settings(BaseSettings):
     # OpenAI
     openai_api_key: str = ""
 
+    # Knowledge embedder (see db.session.create_embedder); switching needs a reload
+    knowledge_embedder: Literal["openai", "local"] = "openai"
+
+    # Semantic answer cache for standalone /ask questions (0 TTL disables)
+    response_cache_similarity: float = 0.97
+    response_cache_ttl_hours: float = 24.0
+
+    # /ask/batch: max questions per request, concurrent agent runs per process
+    batch_max_size: int = 50
+    batch_concurrency: int = 8
+
     # Runtime
     runtime_env: str = "dev"
     log_level: str = "INFO"
@@ -1,5 +1,18 @@
-"""Dash — self-learning data agent with 6 layers of context."""
+"""Dash — self-learning data agent with 6 layers of context.
 
-from dash.agent import dash, dash_knowledge, dash_learnings
+dash.agent (the agent, its Knowledge tables and their DB setup) is
+imported on first use, so submodules such as dash.tools.memoize can be
+imported without connecting to dash-db.
+"""
+
+_AGENT_EXPORTS = {"dash", "dash_knowledge", "dash_learnings"}
 
 __all__ = ["dash", "dash_knowledge", "dash_learnings"]
+
+
+def __getattr__(name: str):
+    if name in _AGENT_EXPORTS:
+        from dash import agent
+
+        return getattr(agent, name)
+    raise AttributeError(f"module 'dash' has no attribute {name!r}")
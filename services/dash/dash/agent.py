@@ -16,15 +16,21 @@ from agno.tools.sql import SQLTools
 from config import settings
 from dash.context.business_rules import BUSINESS_CONTEXT
 from dash.context.semantic_model import SEMANTIC_MODEL_STR
-from dash.tools import create_introspect_schema_tool, create_save_validated_query_tool
-from db import create_knowledge, get_postgres_db
+from dash.tools import (
+    create_introspect_schema_tool,
+    create_save_validated_query_tool,
+    create_tool_memo_hook,
+)
+from db import create_db_engine, create_knowledge, get_postgres_db
 
 # ---------------------------------------------------------------------------
 # Setup
 # ---------------------------------------------------------------------------
 
-# DATA_DB_URL: Supabase read-only connection for customer data queries
+# DATA_DB_URL: Supabase read-only connection for customer data queries.
+# SQLTools and introspect_schema share one pool.
 data_db_url = settings.data_db_url
+data_engine = create_db_engine(data_db_url)
 
 # Agent state DB: Dash's own PgVector DB (via DB_* env vars)
 agent_db = get_postgres_db()
@@ -37,14 +43,23 @@ dash_learnings = create_knowledge("Dash Learnings", "dash_learnings")
 # Tools
 # ---------------------------------------------------------------------------
 save_validated_query = create_save_validated_query_tool(dash_knowledge)
-introspect_schema = create_introspect_schema_tool(data_db_url)
+introspect_schema = create_introspect_schema_tool(data_engine)
 
 dash_tools: list = [
-    SQLTools(db_url=data_db_url),
+    SQLTools(db_engine=data_engine),
     save_validated_query,
     introspect_schema,
 ]
 
+# Repeated read-only calls within a session reuse the earlier result.
+# Schema is effectively static; query results get a short window.
+tool_memo_hook = create_tool_memo_hook({
+    "introspect_schema": 3600,
+    "list_tables": 3600,
+    "describe_table": 3600,
+    "run_sql_query": 300,
+})
+
 # ---------------------------------------------------------------------------
 # Instructions
 # ---------------------------------------------------------------------------
@@ -143,10 +158,17 @@ dash = Agent(
         learned_knowledge=LearnedKnowledgeConfig(mode=LearningMode.AGENTIC),
     ),
     tools=dash_tools,
+    tool_hooks=[tool_memo_hook],
     add_datetime_to_context=True,
+    # Date only: a per-request timestamp would change the system prompt on every
+    # call and stop OpenAI's prompt cache from matching past it
+    datetime_format="%Y-%m-%d",
     add_history_to_context=True,
     read_chat_history=True,
-    num_history_runs=5,
+    # History is dominated by tool output (SQL rows, schema dumps, knowledge hits);
+    # keep the recent conversation but only the latest few tool results
+    num_history_runs=3,
+    max_tool_calls_from_history=3,
     markdown=True,
 )
 
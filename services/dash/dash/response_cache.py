@@ -0,0 +1,111 @@
+"""Semantic response cache for standalone Dash questions.
+
+Analytics questions repeat with small wording changes ("subscription status
+distribution" asked every morning). Answers are stored with the question's
+embedding; a new question whose embedding is close enough (cosine
+similarity >= threshold) to a fresh cached one gets the stored answer
+without an LLM run.
+
+Only standalone questions (no conversation history) are cached: a
+follow-up like "and last week?" means different things in different
+sessions.
+"""
+
+import structlog
+from agno.knowledge.embedder.openai import OpenAIEmbedder
+from sqlalchemy import Engine, text
+
+logger = structlog.get_logger()
+
+CACHE_TABLE = "ai.dash_response_cache"
+
+
+def _to_halfvec(embedding: list[float]) -> str:
+    return "[" + ",".join(map(str, embedding)) + "]"
+
+
+class SemanticResponseCache:
+    """Embedding-keyed answer cache stored in Dash's PgVector database."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        similarity_threshold: float = 0.97,
+        ttl_hours: float = 24.0,
+        dimensions: int = 1536,
+    ) -> None:
+        self.engine = engine
+        self.embedder = OpenAIEmbedder(id="text-embedding-3-small")
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_hours * 3600
+        self.dimensions = dimensions
+        self._table_ready = False
+
+    def _ensure_table(self) -> None:
+        if self._table_ready:
+            return
+        with self.engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+            conn.execute(text("CREATE SCHEMA IF NOT EXISTS ai"))
+            conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {CACHE_TABLE} ("
+                "id BIGSERIAL PRIMARY KEY, "
+                "prompt TEXT NOT NULL, "
+                f"embedding halfvec({self.dimensions}) NOT NULL, "
+                "response TEXT NOT NULL, "
+                "created_at TIMESTAMPTZ NOT NULL DEFAULT NOW())"
+            ))
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS idx_dash_response_cache_embedding "
+                f"ON {CACHE_TABLE} USING hnsw (embedding halfvec_cosine_ops)"
+            ))
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS idx_dash_response_cache_created "
+                f"ON {CACHE_TABLE} (created_at)"
+            ))
+        self._table_ready = True
+
+    def lookup(self, prompt: str) -> tuple[str | None, list[float]]:
+        """Find a fresh cached answer for a semantically equivalent prompt.
+
+        Args:
+            prompt: The user's question.
+
+        Returns:
+            (cached answer or None, prompt embedding for a later store()).
+        """
+        embedding = self.embedder.get_embedding(prompt)
+        self._ensure_table()
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                text(
+                    f"SELECT response, 1 - (embedding <=> CAST(:embedding AS halfvec)) AS similarity "
+                    f"FROM {CACHE_TABLE} "
+                    "WHERE created_at > NOW() - make_interval(secs => :ttl) "
+                    "ORDER BY embedding <=> CAST(:embedding AS halfvec) "
+                    "LIMIT 1"
+                ),
+                {"embedding": _to_halfvec(embedding), "ttl": self.ttl_seconds},
+            ).first()
+
+        if row is not None and row.similarity >= self.similarity_threshold:
+            logger.info("dash_response_cache_hit", similarity=round(row.similarity, 4))
+            return row.response, embedding
+        logger.info("dash_response_cache_miss")
+        return None, embedding
+
+    def store(self, prompt: str, embedding: list[float], response: str) -> None:
+        """Cache an answer and drop expired entries."""
+        self._ensure_table()
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(f"DELETE FROM {CACHE_TABLE} WHERE created_at <= NOW() - make_interval(secs => :ttl)"),
+                {"ttl": self.ttl_seconds},
+            )
+            conn.execute(
+                text(
+                    f"INSERT INTO {CACHE_TABLE} (prompt, embedding, response) "
+                    "VALUES (:prompt, CAST(:embedding AS halfvec), :response)"
+                ),
+                {"prompt": prompt, "embedding": _to_halfvec(embedding), "response": response},
+            )
@@ -1,9 +1,11 @@
 """Dash tools."""
 
 from dash.tools.introspect import create_introspect_schema_tool
+from dash.tools.memoize import create_tool_memo_hook
 from dash.tools.save_query import create_save_validated_query_tool
 
 __all__ = [
     "create_introspect_schema_tool",
     "create_save_validated_query_tool",
+    "create_tool_memo_hook",
 ]
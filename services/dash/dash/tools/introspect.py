@@ -1,17 +1,29 @@
 """Runtime schema inspection (Layer 6).
 
 Inspects the DATA database (Supabase), not Dash's own PgVector DB.
+Per-table schema output (without sample rows) is cached process-wide:
+it only changes with migrations and is the same for every session. The
+table listing carries live row counts, so it is never cached.
 """
 
+import threading
+import time
+
 from agno.tools import tool
 from agno.utils.log import logger
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import Engine, inspect, text
 from sqlalchemy.exc import DatabaseError, OperationalError
 
 
-def create_introspect_schema_tool(data_db_url: str):
-    """Create introspect_schema tool connected to the data database."""
-    engine = create_engine(data_db_url)
+def create_introspect_schema_tool(engine: Engine, cache_ttl_seconds: float = 3600):
+    """Create introspect_schema tool connected to the data database.
+
+    Args:
+        engine: Engine for the data database.
+        cache_ttl_seconds: How long per-table schema results are reused (0 disables).
+    """
+    schema_cache: dict[str, tuple[float, str]] = {}
+    lock = threading.Lock()
 
     @tool
     def introspect_schema(
@@ -26,6 +38,23 @@ def create_introspect_schema_tool(data_db_url: str):
             include_sample_data: Include sample rows.
             sample_limit: Number of sample rows.
         """
+        if table_name is None or include_sample_data or cache_ttl_seconds <= 0:
+            return _introspect(table_name, include_sample_data, sample_limit)
+
+        now = time.monotonic()
+        with lock:
+            entry = schema_cache.get(table_name)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+        result = _introspect(table_name, include_sample_data, sample_limit)
+        # Only real tables are cached (errors and unknown names are not), so size stays bounded
+        if not result.startswith(("Error", f"Table '{table_name}' not found")):
+            with lock:
+                schema_cache[table_name] = (now + cache_ttl_seconds, result)
+        return result
+
+    def _introspect(table_name: str | None, include_sample_data: bool, sample_limit: int) -> str:
         try:
             insp = inspect(engine)
 
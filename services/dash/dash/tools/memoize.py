@@ -0,0 +1,76 @@
+"""Per-session memoization of read-only tool calls.
+
+Within a conversation the model often repeats the exact same call
+(re-listing tables, re-running a SELECT after an unrelated error). A tool
+hook short-circuits repeats with the earlier result instead of another
+round trip to Supabase. Keys are scoped by session, so different
+conversations never share results. Error results and calls that ask for
+live sample rows are never cached.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+import structlog
+from agno.run import RunContext
+
+logger = structlog.get_logger()
+
+
+def create_tool_memo_hook(
+    ttl_seconds: dict[str, float],
+    max_size: int = 512,
+    live_arguments: tuple[str, ...] = ("include_sample_data",),
+) -> Callable:
+    """Create an agno tool hook that caches results of the listed tools.
+
+    Args:
+        ttl_seconds: Tool name -> how long a result stays valid. Tools not
+            listed (e.g. anything that writes) always run.
+        max_size: Maximum cached results across all sessions (LRU).
+        live_arguments: Arguments that, when truthy, request live data;
+            such calls always run.
+    """
+    entries: OrderedDict[tuple[str, str, str], tuple[float, Any]] = OrderedDict()
+    lock = threading.Lock()
+
+    def memoize_tool_call(
+        function_name: str,
+        function_call: Callable,
+        arguments: dict[str, Any],
+        run_context: RunContext,
+    ) -> Any:
+        ttl = ttl_seconds.get(function_name)
+        if ttl is None or any(arguments.get(name) for name in live_arguments):
+            return function_call(**arguments)
+
+        args_hash = hashlib.blake2b(
+            json.dumps(arguments, sort_keys=True, default=str).encode(), digest_size=16
+        ).hexdigest()
+        key = (run_context.session_id or "", function_name, args_hash)
+        now = time.monotonic()
+        with lock:
+            entry = entries.get(key)
+            if entry is not None and entry[0] > now:
+                entries.move_to_end(key)
+                logger.debug("tool_memo_hit", tool=function_name)
+                return entry[1]
+
+        logger.debug("tool_memo_miss", tool=function_name)
+        result = function_call(**arguments)
+        # Tools report failures as "Error: ..." strings; a transient error
+        # must not stick for the rest of the TTL
+        if isinstance(result, str) and result.startswith("Error"):
+            return result
+        with lock:
+            entries[key] = (now + ttl, result)
+            entries.move_to_end(key)
+            while len(entries) > max_size:
+                entries.popitem(last=False)
+        return result
+
+    return memoize_tool_call
@@ -1,10 +1,38 @@
-"""Database module — connection utilities."""
+"""Database module — connection utilities.
+
+db.session (agno, pgvector, the shared engine) is imported on first use,
+so main._wait_for_db can import db.url without loading the agent stack.
+"""
 
-from db.session import create_knowledge, get_postgres_db
 from db.url import db_url
 
+_SESSION_EXPORTS = {
+    "configure_hnsw_params",
+    "configure_vector_index",
+    "create_db_engine",
+    "create_embedder",
+    "create_knowledge",
+    "db_engine",
+    "get_postgres_db",
+    "rebuild_vector_index",
+}
+
 __all__ = [
+    "configure_hnsw_params",
+    "configure_vector_index",
+    "create_db_engine",
+    "create_embedder",
     "create_knowledge",
+    "db_engine",
     "db_url",
     "get_postgres_db",
+    "rebuild_vector_index",
 ]
+
+
+def __getattr__(name: str):
+    if name in _SESSION_EXPORTS:
+        from db import session
+
+        return getattr(session, name)
+    raise AttributeError(f"module 'db' has no attribute {name!r}")
@@ -0,0 +1,110 @@
+"""PgVector variant that stores embeddings as half-precision halfvec.
+
+HNSW search is dominated by reading vectors, so FP16 storage halves the
+table and index size (and the bytes touched per search) with negligible
+recall loss for OpenAI embeddings.
+
+Hybrid search is replaced with Reciprocal Rank Fusion of separate vector
+and full-text rankings, which holds up better than a weighted score mix
+on Dash's mixed SQL/JSON/prose knowledge.
+"""
+
+import copy
+from typing import Any
+
+from agno.knowledge.document import Document
+from agno.utils.log import logger
+from agno.vectordb.pgvector import PgVector
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import Table, text
+
+# Candidates taken from each ranking before fusion
+RRF_CANDIDATES = 50
+# RRF damping constant (standard value from Cormack et al.)
+RRF_K = 60
+
+
+class HalfVecPgVector(PgVector):
+    """PgVector with a halfvec(dimensions) embedding column."""
+
+    def get_table_v1(self) -> Table:
+        table = super().get_table_v1()
+        table.c.embedding.type = HALFVEC(self.dimensions)
+        return table
+
+    def create(self) -> None:
+        """Create the table, or convert an existing vector column to halfvec."""
+        super().create()
+        self._convert_embedding_column()
+
+    def hybrid_search(self, query: str, limit: int = 5, filters: Any = None) -> list[Document]:
+        """Fuse vector and keyword rankings with RRF: score = sum 1 / (k + rank).
+
+        The reranker (if any) runs once on the fused list, not inside the
+        vector leg.
+        """
+        # vector_search reranks with self.reranker; search through a shallow
+        # copy without one so results are not reranked twice
+        unranked = copy.copy(self)
+        unranked.reranker = None
+        rankings = [
+            unranked.vector_search(query=query, limit=RRF_CANDIDATES, filters=filters),
+            self.keyword_search(query=query, limit=RRF_CANDIDATES, filters=filters),
+        ]
+        scores: dict[str, float] = {}
+        documents: dict[str, Document] = {}
+        for ranking in rankings:
+            for rank, doc in enumerate(ranking, start=1):
+                key = doc.id or doc.content
+                scores[key] = scores.get(key, 0.0) + 1.0 / (RRF_K + rank)
+                documents.setdefault(key, doc)
+
+        fused = sorted(scores, key=scores.__getitem__, reverse=True)[:limit]
+        results = []
+        for key in fused:
+            doc = documents[key]
+            doc.meta_data = {**(doc.meta_data or {}), "rrf_score": scores[key]}
+            results.append(doc)
+        if self.reranker:
+            results = self.reranker.rerank(query=query, documents=results)
+        return results
+
+    def _create_hnsw_index(self, sess, table_fullname: str, index_distance: str) -> None:
+        # agno picks vector_*_ops; halfvec columns need the halfvec_*_ops classes
+        super()._create_hnsw_index(sess, table_fullname, index_distance.replace("vector_", "halfvec_", 1))
+
+    def _create_ivfflat_index(self, sess, table_fullname: str, index_distance: str) -> None:
+        super()._create_ivfflat_index(sess, table_fullname, index_distance.replace("vector_", "halfvec_", 1))
+
+    def _convert_embedding_column(self) -> None:
+        """ALTER a table created before the halfvec switch (idempotent)."""
+        with self.Session() as sess, sess.begin():
+            column = sess.execute(
+                text(
+                    "SELECT t.typname, a.atttypmod AS dimensions FROM pg_attribute a "
+                    "JOIN pg_type t ON t.oid = a.atttypid "
+                    "WHERE a.attrelid = to_regclass(:table) AND a.attname = 'embedding'"
+                ),
+                {"table": self.table.fullname},
+            ).first()
+            if column is None:
+                return
+            if column.dimensions != self.dimensions:
+                # Embeddings from another model cannot be converted, only regenerated
+                raise ValueError(
+                    f"{self.table.fullname}.embedding has {column.dimensions} dimensions but the "
+                    f"embedder produces {self.dimensions}; drop the table and rerun scripts/load_knowledge.py"
+                )
+            if column.typname != "vector":
+                return
+
+            logger.info(f"Converting {self.table.fullname}.embedding to halfvec({self.dimensions})")
+            # The old index uses vector_*_ops and cannot survive the type change
+            if self.vector_index is not None and self.vector_index.name:
+                sess.execute(text(f'DROP INDEX IF EXISTS "{self.schema}"."{self.vector_index.name}"'))
+            sess.execute(
+                text(
+                    f"ALTER TABLE {self.table.fullname} ALTER COLUMN embedding "
+                    f"TYPE halfvec({self.dimensions}) USING embedding::halfvec({self.dimensions})"
+                )
+            )
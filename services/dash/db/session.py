@@ -6,32 +6,143 @@ Uses Dash's own PgVector database for:
 - Learnings vectors (auto-discovered error patterns)
 """
 
+from functools import cache
+
 from agno.db.postgres import PostgresDb
 from agno.knowledge import Knowledge
+from agno.knowledge.embedder.base import Embedder
 from agno.knowledge.embedder.openai import OpenAIEmbedder
-from agno.vectordb.pgvector import PgVector, SearchType
+from agno.vectordb.pgvector import HNSW, Ivfflat, SearchType
+from sqlalchemy import Engine, create_engine
 
+from config import settings
+from db.halfvec import HalfVecPgVector
 from db.url import db_url
 
 DB_ID = "dash-db"
 
+# Connection pool per database, shared by every component that talks to it
+DB_POOL_SIZE = 5
+DB_MAX_OVERFLOW = 10
+
+# Search-time candidate list for HNSW (agno's default of 5 costs recall)
+HNSW_EF_SEARCH = 100
+
+# Index build settings, applied with SET before CREATE INDEX
+HNSW_BUILD_CONFIGURATION = {
+    "maintenance_work_mem": "2GB",
+    "max_parallel_maintenance_workers": 7,
+}
+
+# Past this many vectors HNSW builds take hours and can exhaust
+# maintenance_work_mem; IVFFlat builds in minutes (lists = sqrt(n))
+IVFFLAT_MIN_VECTORS = 1_000_000
+# Lists scanned per IVFFlat search
+IVFFLAT_PROBES = 32
+
+
+def create_db_engine(url: str, **kwargs) -> Engine:
+    """Create a pooled SQLAlchemy engine."""
+    return create_engine(
+        url,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        **kwargs,
+    )
+
+
+# One pool for agent state, knowledge vectors and contents instead of one per component.
+# ivfflat.probes is set per connection: the agent's PgVector objects are built
+# before the index type is known, and the setting is ignored by HNSW scans.
+db_engine = create_db_engine(db_url, connect_args={"options": f"-c ivfflat.probes={IVFFLAT_PROBES}"})
+
 
 def get_postgres_db(contents_table: str | None = None) -> PostgresDb:
     """Create a PostgresDb instance."""
     if contents_table is not None:
-        return PostgresDb(id=DB_ID, db_url=db_url, knowledge_table=contents_table)
-    return PostgresDb(id=DB_ID, db_url=db_url)
+        return PostgresDb(id=DB_ID, db_engine=db_engine, knowledge_table=contents_table)
+    return PostgresDb(id=DB_ID, db_engine=db_engine)
+
+
+@cache
+def create_embedder() -> Embedder:
+    """Create the knowledge embedder (one instance shared by all tables).
+
+    settings.knowledge_embedder picks "openai" (text-embedding-3-small,
+    1536d) or "local" (bge-small-en-v1.5 on ONNX Runtime via fastembed,
+    384d, no network call; needs `pip install fastembed`). Switching
+    changes the vector dimension, so the knowledge tables must be dropped
+    and reloaded.
+    """
+    if settings.knowledge_embedder == "local":
+        from agno.knowledge.embedder.fastembed import FastEmbedEmbedder
+
+        return FastEmbedEmbedder()
+    # Embed all chunks of a document in one request instead of one per chunk
+    return OpenAIEmbedder(id="text-embedding-3-small", enable_batch=True)
+
+
+def configure_hnsw_params(table_name: str, vector_count: int = 0) -> HNSW:
+    """Pick HNSW build parameters for the expected number of vectors.
+
+    Denser graphs (higher m / ef_construction) cost build time and memory
+    but keep recall up as the table grows past ~100K vectors.
+    """
+    if vector_count < 100_000:
+        m, ef_construction = 24, 128
+    elif vector_count < 1_000_000:
+        m, ef_construction = 32, 200
+    else:
+        m, ef_construction = 48, 256
+    return HNSW(
+        name=f"idx_{table_name}_embedding_hnsw",
+        m=m,
+        ef_construction=ef_construction,
+        ef_search=HNSW_EF_SEARCH,
+        configuration=HNSW_BUILD_CONFIGURATION,
+    )
+
+
+def configure_vector_index(table_name: str, vector_count: int = 0) -> HNSW | Ivfflat:
+    """Pick the ANN index for the number of vectors: HNSW, or IVFFlat past IVFFLAT_MIN_VECTORS."""
+    if vector_count < IVFFLAT_MIN_VECTORS:
+        return configure_hnsw_params(table_name, vector_count)
+    return Ivfflat(
+        name=f"idx_{table_name}_embedding_ivfflat",
+        probes=IVFFLAT_PROBES,
+        # agno sizes lists as sqrt(n) above 1M rows
+        dynamic_lists=True,
+        configuration=HNSW_BUILD_CONFIGURATION,
+    )
+
+
+def rebuild_vector_index(vector_db: HalfVecPgVector) -> HNSW | Ivfflat:
+    """Rebuild a knowledge table's ANN index sized for its current row count.
+
+    Drops the index of the other type, so crossing IVFFLAT_MIN_VECTORS (in
+    either direction) switches the table over.
+    """
+    table_name = vector_db.table_name
+    index = configure_vector_index(table_name, vector_db.get_count())
+    for name in (f"idx_{table_name}_embedding_hnsw", f"idx_{table_name}_embedding_ivfflat"):
+        if name != index.name:
+            vector_db._drop_index(name)
+    vector_db.vector_index = index
+    vector_db.optimize(force_recreate=True)
+    return index
 
 
 def create_knowledge(name: str, table_name: str) -> Knowledge:
-    """Create a Knowledge instance with PgVector hybrid search."""
+    """Create a Knowledge instance with PgVector hybrid search (halfvec storage)."""
     return Knowledge(
         name=name,
-        vector_db=PgVector(
-            db_url=db_url,
+        vector_db=HalfVecPgVector(
+            db_engine=db_engine,
             table_name=table_name,
             search_type=SearchType.hybrid,
-            embedder=OpenAIEmbedder(id="text-embedding-3-small"),
+            vector_index=configure_hnsw_params(table_name),
+            embedder=create_embedder(),
         ),
         contents_db=get_postgres_db(contents_table=f"{table_name}_contents"),
     )
@@ -20,53 +20,211 @@ structlog.configure(
 logger = structlog.get_logger()
 
 
-def _wait_for_db(max_retries: int = 30, delay: float = 2.0) -> None:
-    """Wait for dash-db to be reachable before importing agent modules."""
+def _wait_for_db(timeout: float = 60.0, delay: float = 0.25) -> None:
+    """Wait for dash-db to be reachable before importing agent modules.
+
+    Polls the TCP port (cheap) until it accepts connections, then confirms
+    with a single SELECT 1 (Postgres accepts connections while still
+    starting up, and this also checks credentials).
+    """
+    import socket
+
     from db.url import db_url
     from sqlalchemy import create_engine, text
-
-    engine = create_engine(db_url, pool_pre_ping=True)
-    for attempt in range(1, max_retries + 1):
-        try:
-            with engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
-            logger.info("dash-db is ready", attempt=attempt)
-            engine.dispose()
-            return
-        except Exception as exc:
-            logger.warning(
-                "dash-db not ready, retrying",
-                attempt=attempt,
-                max_retries=max_retries,
-                error=str(exc),
-            )
-            time.sleep(delay)
-    engine.dispose()
-    raise RuntimeError(f"dash-db not reachable after {max_retries} attempts")
+    from sqlalchemy.pool import NullPool
+
+    host = getenv("DB_HOST", "localhost")
+    port = int(getenv("DB_PORT", "5432"))
+    deadline = time.monotonic() + timeout
+    engine = create_engine(db_url, poolclass=NullPool)
+    attempt = 0
+    try:
+        while True:
+            attempt += 1
+            try:
+                with socket.create_connection((host, port), timeout=1.0):
+                    pass
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                logger.info("dash-db is ready", attempt=attempt)
+                return
+            except Exception as exc:
+                if time.monotonic() >= deadline:
+                    raise RuntimeError(f"dash-db not reachable after {timeout:.0f}s") from exc
+                # Attempts are 0.25 s apart; log roughly every 2 s
+                if attempt % 8 == 1:
+                    logger.warning("dash-db not ready, retrying", attempt=attempt, error=str(exc))
+                time.sleep(delay)
+    finally:
+        engine.dispose()
+
+
+# Knowledge tables and their vector indexes (whichever type exists)
+PREWARM_RELATIONS = [
+    f"ai.{relation}"
+    for table in ("dash_knowledge", "dash_learnings")
+    for relation in (table, f"idx_{table}_embedding_hnsw", f"idx_{table}_embedding_ivfflat")
+]
+
+
+def _prewarm_knowledge() -> None:
+    """Load knowledge tables and vector indexes into shared_buffers.
+
+    After a dash-db restart the first searches otherwise pay for cold
+    index page reads. Best effort: failures are logged, not raised.
+    """
+    from db.url import db_url
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.pool import NullPool
+
+    engine = create_engine(db_url, poolclass=NullPool)
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_prewarm"))
+            rows = conn.execute(
+                text(
+                    "SELECT relation, pg_prewarm(to_regclass(relation)) AS pages "
+                    "FROM unnest(CAST(:relations AS text[])) AS relation "
+                    "WHERE to_regclass(relation) IS NOT NULL"
+                ),
+                {"relations": PREWARM_RELATIONS},
+            ).all()
+        logger.info("Prewarmed dash-db knowledge", pages={row.relation: row.pages for row in rows})
+    except Exception as exc:
+        logger.warning("dash-db prewarm failed", error=str(exc))
+    finally:
+        engine.dispose()
 
 
 # Module-level app: deferred until after DB wait at startup
 app = None  # type: ignore[assignment]
 
 
+def _create_base_app():
+    """FastAPI routes served next to AgentOS's own."""
+    import asyncio
+    from contextlib import nullcontext
+
+    from fastapi import FastAPI
+    from pydantic import BaseModel, Field
+
+    from config import settings
+    from dash.agent import dash, data_engine
+    from dash.response_cache import SemanticResponseCache
+    from db import db_engine
+
+    base_app = FastAPI(title="Dash Analytics")
+    response_cache = (
+        SemanticResponseCache(
+            db_engine,
+            similarity_threshold=settings.response_cache_similarity,
+            ttl_hours=settings.response_cache_ttl_hours,
+        )
+        if settings.response_cache_ttl_hours > 0
+        else None
+    )
+
+    class AskRequest(BaseModel):
+        message: str
+
+    class AskBatchRequest(BaseModel):
+        messages: list[str] = Field(min_length=1, max_length=settings.batch_max_size)
+
+    async def answer(message: str, slots: asyncio.Semaphore | None = None) -> dict:
+        """Answer one question; only agent runs (not cache hits) take a slot."""
+        embedding = None
+        if response_cache is not None:
+            # The cache is an optimisation: on any failure, answer uncached
+            try:
+                cached, embedding = await asyncio.to_thread(response_cache.lookup, message)
+            except Exception as exc:
+                logger.warning("response_cache_lookup_failed", error=str(exc))
+                cached = None
+            if cached is not None:
+                return {"content": cached, "cached": True}
+
+        async with slots or nullcontext():
+            run = await dash.arun(message)
+        if response_cache is not None and embedding is not None and run.content:
+            try:
+                await asyncio.to_thread(response_cache.store, message, embedding, str(run.content))
+            except Exception as exc:
+                logger.warning("response_cache_store_failed", error=str(exc))
+        return {"content": run.content, "cached": False}
+
+    @base_app.post("/ask")
+    async def ask(request: AskRequest) -> dict:
+        """Answer a standalone question, reusing cached answers to equivalent ones."""
+        return await answer(request.message)
+
+    # Shared by all batch requests, so concurrent batches cannot multiply agent runs
+    batch_slots = asyncio.Semaphore(settings.batch_concurrency)
+
+    @base_app.post("/ask/batch")
+    async def ask_batch(request: AskBatchRequest) -> list[dict]:
+        """Answer independent questions concurrently, in request order.
+
+        A failed question yields {"error": ...} in its slot; the other
+        answers are still returned.
+        """
+        results = await asyncio.gather(
+            *(answer(message, batch_slots) for message in request.messages),
+            return_exceptions=True,
+        )
+        items = []
+        for message, result in zip(request.messages, results):
+            if isinstance(result, BaseException):
+                logger.warning("ask_batch_item_failed", message=message[:200], error=str(result))
+                items.append({"error": str(result) or type(result).__name__})
+            else:
+                items.append(result)
+        return items
+
+    @base_app.get("/debug/pool")
+    async def pool_status() -> dict:
+        """Connection pool usage for dash-db and the data database."""
+        return {
+            name: {
+                "size": engine.pool.size(),
+                "checked_in": engine.pool.checkedin(),
+                "checked_out": engine.pool.checkedout(),
+                "overflow": engine.pool.overflow(),
+            }
+            for name, engine in (("dash_db", db_engine), ("data_db", data_engine))
+        }
+
+    return base_app
+
+
 def _create_app():
     """Create the AgentOS FastAPI app (call after DB is ready)."""
+    import hashlib
+
     from agno.os import AgentOS
 
-    from dash.agent import dash
+    from dash.agent import INSTRUCTIONS, dash
     from db import get_postgres_db
 
+    # Same hash across workers/restarts means the same cacheable prompt prefix
+    logger.info(
+        "Dash instructions loaded",
+        sha256=hashlib.sha256(INSTRUCTIONS.encode()).hexdigest()[:16],
+        chars=len(INSTRUCTIONS),
+    )
+
     agent_os = AgentOS(
         name="Dash Analytics",
         agents=[dash],
         tracing=True,
         db=get_postgres_db(),
+        base_app=_create_base_app(),
     )
     return agent_os
 
 
 if __name__ == "__main__":
     _wait_for_db()
+    _prewarm_knowledge()
     agent_os = _create_app()
     app = agent_os.get_app()
     logger.info("Starting Dash Analytics Agent", port=9000)
@@ -2,88 +2,111 @@
 
 Run after dash-db is up:
     docker compose exec dash python scripts/load_knowledge.py
+
+Files are read in parallel threads, then inserted concurrently; each document's chunks
+are embedded in batched OpenAI requests (see create_knowledge).
 """
 
+import asyncio
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from db import create_knowledge  # noqa: E402
+from db import create_knowledge, rebuild_vector_index  # noqa: E402
 
 KNOWLEDGE_DIR = Path(__file__).parent.parent / "dash" / "knowledge"
 
 knowledge = create_knowledge("Dash Knowledge", "dash_knowledge")
 
+# Max concurrent inserts (each embeds and upserts one document)
+INSERT_CONCURRENCY = 8
+
+# Threads for reading knowledge files
+READ_WORKERS = 16
+
+
+def read_files(paths: list[Path]) -> list[str]:
+    """Read files in parallel, preserving order."""
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+        return list(pool.map(Path.read_text, paths))
+
 
-def load_tables() -> int:
-    """Load table metadata JSON files."""
+def load_tables() -> list[dict[str, str]]:
+    """Collect table metadata JSON files."""
     tables_dir = KNOWLEDGE_DIR / "tables"
     if not tables_dir.exists():
         print(f"Tables directory not found: {tables_dir}")
-        return 0
+        return []
 
-    count = 0
-    for filepath in sorted(tables_dir.glob("*.json")):
-        with open(filepath) as f:
-            table = json.load(f)
+    docs = []
+    for raw in read_files(sorted(tables_dir.glob("*.json"))):
+        # Files are already pretty-printed; parse only for the table name
+        table_name = json.loads(raw)["table_name"]
 
-        content = json.dumps(table, ensure_ascii=False, indent=2)
-        knowledge.insert(
-            name=f"table_{table['table_name']}",
-            text_content=content,
-            upsert=True,
-        )
-        print(f"  Loaded table: {table['table_name']}")
-        count += 1
+        docs.append({
+            "name": f"table_{table_name}",
+            "text_content": raw,
+            "label": f"table: {table_name}",
+        })
 
-    return count
+    return docs
 
 
-def load_business_rules() -> int:
-    """Load business rules JSON files."""
+def load_business_rules() -> list[dict[str, str]]:
+    """Collect business rules JSON files."""
     business_dir = KNOWLEDGE_DIR / "business"
     if not business_dir.exists():
-        return 0
+        return []
 
-    count = 0
-    for filepath in sorted(business_dir.glob("*.json")):
-        with open(filepath) as f:
-            data = json.load(f)
+    paths = sorted(business_dir.glob("*.json"))
+    docs = []
+    for filepath, raw in zip(paths, read_files(paths)):
+        docs.append({
+            "name": f"rules_{filepath.stem}",
+            "text_content": raw,
+            "label": f"rules: {filepath.stem}",
+        })
 
-        content = json.dumps(data, ensure_ascii=False, indent=2)
-        knowledge.insert(
-            name=f"rules_{filepath.stem}",
-            text_content=content,
-            upsert=True,
-        )
-        print(f"  Loaded rules: {filepath.stem}")
-        count += 1
+    return docs
 
-    return count
 
-
-def load_queries() -> int:
-    """Load validated SQL query files."""
+def load_queries() -> list[dict[str, str]]:
+    """Collect validated SQL query files."""
     queries_dir = KNOWLEDGE_DIR / "queries"
     if not queries_dir.exists():
-        return 0
+        return []
+
+    paths = sorted(queries_dir.glob("*.sql"))
+    docs = []
+    for filepath, raw in zip(paths, read_files(paths)):
+        docs.append({
+            "name": f"queries_{filepath.stem}",
+            "text_content": raw,
+            "label": f"queries: {filepath.stem}",
+        })
+
+    return docs
 
-    count = 0
-    for filepath in sorted(queries_dir.glob("*.sql")):
-        with open(filepath) as f:
-            content = f.read()
 
-        knowledge.insert(
-            name=f"queries_{filepath.stem}",
-            text_content=content,
-            upsert=True,
-        )
-        print(f"  Loaded queries: {filepath.stem}")
-        count += 1
+async def insert_docs(docs: list[dict[str, str]]) -> None:
+    """Embed and upsert documents concurrently (bounded by INSERT_CONCURRENCY)."""
+    # Create (or convert) the table once, before concurrent inserts race to do it
+    await knowledge.vector_db.async_create()
+    semaphore = asyncio.Semaphore(INSERT_CONCURRENCY)
 
-    return count
+    async def insert(doc: dict[str, str]) -> None:
+        async with semaphore:
+            await knowledge.ainsert(
+                name=doc["name"],
+                text_content=doc["text_content"],
+                upsert=True,
+            )
+        print(f"  Loaded {doc['label']}")
+
+    await asyncio.gather(*(insert(doc) for doc in docs))
 
 
 if __name__ == "__main__":
@@ -93,6 +116,14 @@ if __name__ == "__main__":
     tables = load_tables()
     rules = load_business_rules()
     queries = load_queries()
+    asyncio.run(insert_docs(tables + rules + queries))
+
+    total = len(tables) + len(rules) + len(queries)
+    print(
+        f"\nDone: {len(tables)} tables, {len(rules)} rule sets, "
+        f"{len(queries)} query files = {total} total"
+    )
 
-    total = tables + rules + queries
-    print(f"\nDone: {tables} tables, {rules} rule sets, {queries} query files = {total} total")
+    # (Re)build the ANN index sized for what is now in the table
+    index = rebuild_vector_index(knowledge.vector_db)
+    print(f"Built vector index {index.name}")
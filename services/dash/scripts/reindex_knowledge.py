@@ -0,0 +1,31 @@
+"""Rebuild the vector indexes of Dash's knowledge and learnings tables.
+
+dash_learnings grows at runtime (save_learning) and is never reloaded, so
+run this periodically (e.g. a weekly cron):
+    docker compose exec dash python scripts/reindex_knowledge.py
+
+Each table gets an index sized for its current row count: HNSW, or
+IVFFlat once it passes IVFFLAT_MIN_VECTORS.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from db import create_knowledge, rebuild_vector_index  # noqa: E402
+
+TABLES = {
+    "dash_knowledge": "Dash Knowledge",
+    "dash_learnings": "Dash Learnings",
+}
+
+
+if __name__ == "__main__":
+    for table_name, name in TABLES.items():
+        vector_db = create_knowledge(name, table_name).vector_db
+        if not vector_db.table_exists():
+            print(f"Skipping {table_name}: table does not exist")
+            continue
+        index = rebuild_vector_index(vector_db)
+        print(f"Built {type(index).__name__} index {index.name} for {table_name}")
@@ -0,0 +1,47 @@
+"""Unit tests for dash/tools/memoize.py (per-session tool memoization)."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from dash.tools.memoize import create_tool_memo_hook
+
+CONTEXT = SimpleNamespace(session_id="s1")
+
+
+def _call(hook, tool_name, function_call, **arguments):
+    return hook(
+        function_name=tool_name,
+        function_call=function_call,
+        arguments=arguments,
+        run_context=CONTEXT,
+    )
+
+
+class TestMemoizeToolCall:
+    def test_repeat_call_is_cached(self):
+        hook = create_tool_memo_hook({"run_sql_query": 300})
+        tool = MagicMock(return_value="rows")
+        assert _call(hook, "run_sql_query", tool, query="SELECT 1") == "rows"
+        assert _call(hook, "run_sql_query", tool, query="SELECT 1") == "rows"
+        assert tool.call_count == 1
+
+    def test_unlisted_tool_always_runs(self):
+        hook = create_tool_memo_hook({"run_sql_query": 300})
+        tool = MagicMock(return_value="saved")
+        _call(hook, "save_validated_query", tool, name="q")
+        _call(hook, "save_validated_query", tool, name="q")
+        assert tool.call_count == 2
+
+    def test_error_result_not_cached(self):
+        hook = create_tool_memo_hook({"run_sql_query": 300})
+        tool = MagicMock(side_effect=["Error: connection reset", "rows"])
+        assert _call(hook, "run_sql_query", tool, query="SELECT 1") == "Error: connection reset"
+        assert _call(hook, "run_sql_query", tool, query="SELECT 1") == "rows"
+        assert tool.call_count == 2
+
+    def test_sample_data_call_not_cached(self):
+        hook = create_tool_memo_hook({"introspect_schema": 3600})
+        tool = MagicMock(return_value="schema + samples")
+        _call(hook, "introspect_schema", tool, table_name="t", include_sample_data=True)
+        _call(hook, "introspect_schema", tool, table_name="t", include_sample_data=True)
+        assert tool.call_count == 2
@@ -0,0 +1,93 @@
+-- Pre-aggregated rollups for the analytics service
+-- Dashboards read these instead of re-scanning chat_sessions on every call.
+-- The analytics service refreshes them periodically via refresh_analytics_rollups().
+
+-- Daily session counts per eval decision (get_daily_trends)
+CREATE MATERIALIZED VIEW mv_daily_session_stats AS
+SELECT
+    DATE_TRUNC('day', created_at) AS day,
+    COUNT(*) AS total,
+    COUNT(*) FILTER (WHERE eval_decision = 'send') AS auto_sent,
+    COUNT(*) FILTER (WHERE eval_decision = 'draft') AS drafted,
+    COUNT(*) FILTER (WHERE eval_decision = 'escalate') AS escalated
+FROM chat_sessions
+GROUP BY 1;
+
+-- Unique index is required for REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX idx_mv_daily_session_stats_day ON mv_daily_session_stats(day);
+
+-- Daily session counts and response-time sums per category (get_category_breakdown)
+CREATE MATERIALIZED VIEW mv_category_daily AS
+SELECT
+    DATE_TRUNC('day', created_at) AS day,
+    primary_category,
+    COUNT(*) AS sessions,
+    COUNT(*) FILTER (WHERE eval_decision = 'send') AS auto_sent,
+    SUM(first_response_time_ms) AS response_time_sum_ms,
+    COUNT(first_response_time_ms) AS response_time_count
+FROM chat_sessions
+GROUP BY 1, 2;
+
+CREATE UNIQUE INDEX idx_mv_category_daily_day_category ON mv_category_daily(day, primary_category);
+
+-- Tool call counts per session (get_learning_candidates)
+CREATE MATERIALIZED VIEW mv_session_tools AS
+SELECT
+    session_id,
+    COUNT(*) AS tool_count,
+    COUNT(DISTINCT tool_name) AS unique_tools
+FROM tool_executions
+GROUP BY session_id;
+
+CREATE UNIQUE INDEX idx_mv_session_tools_session ON mv_session_tools(session_id);
+
+-- Daily HITL confirmation outcomes per tool (get_hitl_stats)
+CREATE MATERIALIZED VIEW mv_hitl_daily AS
+SELECT
+    DATE_TRUNC('day', created_at) AS day,
+    tool_name,
+    COUNT(*) AS total,
+    COUNT(*) FILTER (WHERE approval_status = 'approved') AS approved,
+    COUNT(*) FILTER (WHERE approval_status = 'cancelled') AS cancelled,
+    COUNT(*) FILTER (WHERE approval_status IS NULL) AS pending
+FROM tool_executions
+WHERE requires_approval = true
+GROUP BY 1, 2;
+
+CREATE UNIQUE INDEX idx_mv_hitl_daily_day_tool ON mv_hitl_daily(day, tool_name);
+
+-- Daily session counts per customer (get_customer_patterns)
+CREATE MATERIALIZED VIEW mv_customer_daily AS
+SELECT
+    DATE_TRUNC('day', created_at) AS day,
+    customer_email,
+    COUNT(*) AS sessions,
+    COUNT(*) FILTER (WHERE eval_decision = 'escalate') AS escalated,
+    MAX(created_at) AS last_interaction
+FROM chat_sessions
+WHERE customer_email IS NOT NULL
+GROUP BY 1, 2;
+
+CREATE UNIQUE INDEX idx_mv_customer_daily_day_email ON mv_customer_daily(day, customer_email);
+
+-- Refresh all rollups without blocking readers.
+-- SECURITY DEFINER: analytics_readonly may not own (and so cannot refresh) the views.
+CREATE OR REPLACE FUNCTION refresh_analytics_rollups()
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_daily_session_stats;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_category_daily;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_session_tools;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_hitl_daily;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_customer_daily;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION refresh_analytics_rollups() FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION refresh_analytics_rollups() TO analytics_readonly, service_role;
+
+GRANT SELECT ON mv_daily_session_stats, mv_category_daily, mv_session_tools, mv_hitl_daily, mv_customer_daily TO analytics_readonly, service_role;
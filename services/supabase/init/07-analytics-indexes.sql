@@ -0,0 +1,17 @@
+-- Indexes for the analytics service's time-window queries
+-- All metrics filter on created_at >= <window start>; both tables are append-only,
+-- so BRIN gives range pruning at a fraction of a btree's size.
+
+-- chat_sessions already has a btree on created_at (idx_chat_sessions_created),
+-- which the ai-engine also uses for ORDER BY created_at DESC, so only the
+-- customer-pattern composite is added here.
+
+-- get_customer_patterns: per-customer category counts within the window
+-- (INCLUDE makes the top-category lookup an index-only scan)
+CREATE INDEX idx_chat_sessions_email_created ON chat_sessions(customer_email, created_at) INCLUDE (primary_category);
+
+-- tool_executions had no created_at index at all
+CREATE INDEX idx_tool_executions_created_brin ON tool_executions USING BRIN(created_at) WITH (pages_per_range = 32);
+
+-- get_hitl_stats / mv refresh: approval-required rows within the window
+CREATE INDEX idx_tool_executions_approval_created ON tool_executions(created_at) WHERE requires_approval = true;